@@ -6,21 +6,47 @@ into SQL statements using AI (Gemini/Ollama) and executes them safely.
 """
 
 import streamlit as st
-import pandas as pd
-import requests
+import hashlib
+import io
 import json
+import threading
+from collections import OrderedDict, deque
 from datetime import datetime
+from itertools import islice
 from typing import Dict, Any, Optional, Tuple, List
 
 from src.config import Config
-from src.database_connector import create_database_connector
-from src.logical_names_loader import LogicalNamesLoader
-from src.business_terms_loader import BusinessTermsLoader
+from src.database_connector import ColumnError, TableError, create_database_connector
 from src.prompt_generator import PromptGenerator
-from src.ai_connector import create_ai_connector
 from src.sql_parser import SQLParser
 from src.error_handler import ErrorHandler
-from src.schema_viewer import SchemaViewer
+
+
+# Maximum number of query history entries kept per session (oldest are dropped)
+MAX_HISTORY_ENTRIES = 100
+
+# Maximum number of AI responses cached across sessions (least recently used are dropped)
+MAX_RESPONSE_CACHE_ENTRIES = 256
+
+# Selectable AI models per provider
+GEMINI_MODELS = ("gemini-2.5-flash", "gemini-2.5-pro", "gemini-2.5-flash-lite")
+OLLAMA_MODELS = ("gemma3:12b", "gemma3:27b", "gpt-oss:latest")
+
+# Sample queries (shown only for the bundled sample DB)
+SAMPLE_QUERIES = (
+    "",
+    "30代の会員は何人いますか？",
+    "評価4以上のイタリアンレストランを表示",
+    "2025年1月に最も予約が多かった店舗TOP5",
+    "休眠会員（90日以上予約なし）は何人？",
+)
+
+# SQL execution exception → error type (others are treated as syntax_error)
+ERROR_TYPES = {
+    PermissionError: "permission_error",
+    ColumnError: "column_error",
+    TableError: "table_error",
+}
 
 
 # Page configuration
@@ -32,41 +58,134 @@ st.set_page_config(
 )
 
 
-def check_ollama_available() -> bool:
+@st.cache_resource
+def get_http_session():
     """
-    Check if Ollama server is running.
+    Get a shared HTTP session with keep-alive connection pooling.
 
     Returns:
-        bool: True if Ollama is available, False otherwise
+        requests.Session: Session reused across Streamlit reruns
+
+    Note:
+        Reusing the session avoids a new TCP handshake to the Ollama
+        server on every rerun. The availability probe and OllamaConnector
+        share this session, so generation reuses the probe's connection.
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=0)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def probe_ollama(ollama_url: str) -> bool:
+    """
+    Probe Ollama server with result caching.
+
+    Args:
+        ollama_url: Ollama server URL
+
+    Returns:
+        bool: True if Ollama responded, False otherwise
+
+    Note:
+        The result is cached for 30 seconds so the probe is not sent
+        on every Streamlit rerun.
     """
     try:
-        ollama_url = Config.OLLAMA_HOST
-        response = requests.get(f"{ollama_url}/api/tags", timeout=3)
+        response = get_http_session().get(f"{ollama_url}/api/tags", timeout=3)
         return response.status_code == 200
     except Exception:
         return False
 
 
-def validate_config_on_startup() -> Tuple[Any, List[Dict[str, Any]], Optional[Dict[str, str]], Optional[List[Dict[str, str]]]]:
+def check_ollama_available() -> bool:
+    """
+    Check if Ollama server is running.
+
+    Returns:
+        bool: True if Ollama is available, False otherwise
+    """
+    return probe_ollama(Config.OLLAMA_HOST)
+
+
+@st.cache_resource
+def get_ai_connector(provider: str, model: str):
+    """
+    Get AI connector cached per (provider, model).
+
+    Args:
+        provider: AI provider name shown in UI ("Gemini" or "Ollama")
+        model: Model name
+
+    Returns:
+        AIConnector instance
+
+    Note:
+        SDK clients are reused across queries instead of being
+        re-initialized on every execution. The AI SDK import is deferred
+        until the first query to keep app startup fast.
+    """
+    from src.ai_connector import create_ai_connector
+
+    if provider == "Gemini":
+        return create_ai_connector(
+            "gemini", api_key=Config.GEMINI_API_KEY, model=model
+        )
+    else:  # Ollama
+        return create_ai_connector(
+            "ollama",
+            host=Config.OLLAMA_HOST,
+            model=model,
+            session=get_http_session(),
+        )
+
+
+@st.cache_data(ttl=600, show_spinner=False)
+def load_schema(_connector) -> List[Dict[str, Any]]:
+    """
+    データベーススキーマ取得（キャッシュ付き）
+
+    Args:
+        _connector: 接続済みDatabaseConnector（先頭の_によりキャッシュキーから除外）
+
+    Returns:
+        スキーマ情報のリスト（DatabaseConnector.get_schema()の戻り値）
+
+    Note:
+        main()から毎回呼ばれ、コネクタ（st.cache_resource）とは独立して
+        TTLで期限切れになる。期限切れ後はDB接続を作り直さずに再取得し、
+        スキーマが変わった場合のみget_prompt_generator()が作り直される。
+    """
+    return _connector.get_schema()
+
+
+def validate_config_on_startup() -> Tuple[Any, Optional[Dict[str, str]], Optional[List[Dict[str, str]]]]:
     """
     起動時設定検証とコンポーネント初期化
 
     Returns:
         Tuple containing:
         - connector: DatabaseConnector instance
-        - schema: データベーススキーマ情報
         - logical_names: 論理名マッピング（オプション）
         - business_terms: ビジネス用語定義（オプション）
 
     Raises:
         ValueError: DB設定エラー
-        Exception: DB接続・スキーマ取得失敗
+        Exception: DB接続失敗
+
+    Note:
+        スキーマはここでは取得しない（TTL付きのload_schema()でmain()から取得）。
     """
     # Config validation
     Config.validate()
 
     # DB_TYPE確認
-    if Config.DB_TYPE not in ["sqlite", "mysql"]:
+    if Config.DB_TYPE not in Config.SUPPORTED_DB_TYPES:
         st.error(f"❌ 未対応のDB_TYPE: {Config.DB_TYPE}")
         st.stop()
 
@@ -84,12 +203,9 @@ def validate_config_on_startup() -> Tuple[Any, List[Dict[str, Any]], Optional[Di
         st.error(f"❌ DB接続失敗: {e}")
         st.stop()
 
-    # スキーマ取得
-    try:
-        schema = connector.get_schema()
-    except Exception as e:
-        st.error(f"❌ スキーマ取得失敗: {e}")
-        st.stop()
+    # 論理名・ビジネス用語ローダー（必要時のみimport）
+    from src.logical_names_loader import LogicalNamesLoader
+    from src.business_terms_loader import BusinessTermsLoader
 
     # 論理名ロード（オプション）
     logical_names = None
@@ -106,12 +222,15 @@ def validate_config_on_startup() -> Tuple[Any, List[Dict[str, Any]], Optional[Di
         try:
             path = Config.resolve_path(Config.BUSINESS_TERMS_PATH)
             business_terms = BusinessTermsLoader.load(str(path))
-            if business_terms and len(business_terms) > 200:
-                st.warning(f"⚠️ ビジネス用語は200件まで推奨（現在{len(business_terms)}件）")
+            if business_terms and len(business_terms) >= BusinessTermsLoader.MAX_TERMS:
+                st.warning(
+                    f"⚠️ ビジネス用語は{BusinessTermsLoader.MAX_TERMS}件まで推奨"
+                    f"（先頭{BusinessTermsLoader.MAX_TERMS}件のみ使用）"
+                )
         except (FileNotFoundError, ValueError, json.JSONDecodeError, UnicodeDecodeError) as e:
             st.warning(f"⚠️ ビジネス用語定義読み込み失敗: {e}。用語なしで動作します。")
 
-    return connector, schema, logical_names, business_terms
+    return connector, logical_names, business_terms
 
 
 @st.cache_resource
@@ -122,36 +241,216 @@ def init_system():
     Returns:
         Dictionary containing initialized components:
         - connector: DatabaseConnector instance
-        - schema: データベーススキーマ情報
         - logical_names: 論理名マッピング
         - business_terms: ビジネス用語定義
-        - prompt_gen: PromptGenerator instance
         - sql_parser: SQLParser instance
         - error_handler: ErrorHandler instance
+        - db_info: 接続中DBの表示文字列
+        - is_sample_db: サンプルDB（restaurant.db）使用中か否か
 
     Note:
         This function is cached by Streamlit to avoid re-initialization
         on every rerun. Config validation is performed here.
+        The schema and the PromptGenerator built from it are not held here;
+        see load_schema() and get_prompt_generator().
     """
     # 起動時検証とロード
-    connector, schema, logical_names, business_terms = validate_config_on_startup()
+    connector, logical_names, business_terms = validate_config_on_startup()
 
     # Initialize components
-    prompt_gen = PromptGenerator(schema, logical_names, business_terms)
     sql_parser = SQLParser()
     error_handler = ErrorHandler()
 
+    # DB connection info (sidebar display)
+    if Config.DB_TYPE == "sqlite":
+        db_info = f"**接続中:** SQLite (`{Config.DB_PATH.name}`)"
+    else:  # mysql
+        db_info = f"**接続中:** MySQL (`{Config.DB_NAME}`)"
+
+    # Sample DB detection (sample queries are shown only for the bundled DB)
+    is_sample_db = (
+        Config.DB_TYPE == "sqlite" and
+        Config.DB_PATH.name == "restaurant.db"
+    )
+
     return {
         "connector": connector,
-        "schema": schema,
         "logical_names": logical_names,
         "business_terms": business_terms,
-        "prompt_gen": prompt_gen,
         "sql_parser": sql_parser,
         "error_handler": error_handler,
+        "db_info": db_info,
+        "is_sample_db": is_sample_db,
     }
 
 
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_prompt_generator(
+    schema: List[Dict[str, Any]],
+    _logical_names: Optional[Dict[str, str]],
+    _business_terms: Optional[List[Dict[str, str]]],
+) -> PromptGenerator:
+    """
+    PromptGenerator取得（スキーマ単位でキャッシュ）
+
+    Args:
+        schema: load_schema()の戻り値（キャッシュキー）
+        _logical_names: 論理名マッピング（init_system()で固定のためキャッシュキーから除外）
+        _business_terms: ビジネス用語定義（同上）
+
+    Returns:
+        スキーマ・論理名・ビジネス用語を埋め込んだPromptGenerator
+
+    Note:
+        load_schema()のTTL切れで再取得したスキーマが変わった時だけ作り直し、
+        それまでは静的プレフィックスとプロンプトキャッシュを再利用する。
+    """
+    return PromptGenerator(schema, _logical_names, _business_terms)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def get_schema_viewer(schema: List[Dict[str, Any]], _logical_names: Optional[Dict[str, str]]):
+    """
+    SchemaViewer取得（スキーマ単位でキャッシュ）
+
+    Args:
+        schema: load_schema()の戻り値（キャッシュキー）
+        _logical_names: 論理名マッピング（init_system()で固定のためキャッシュキーから除外）
+
+    Returns:
+        テーブルごとのカラム一覧DataFrameを構築済みのSchemaViewer
+
+    Note:
+        スキーマ一覧ボタンの初回押下時にimport・構築し、スキーマが変わるまで
+        ボタン押下のたびに再利用する。
+    """
+    from src.schema_viewer import SchemaViewer
+
+    return SchemaViewer(schema, _logical_names)
+
+
+def stream_ai_response(ai_connector, prompt: str, sql_parser: SQLParser) -> str:
+    """
+    Stream AI response while displaying it progressively.
+
+    Args:
+        ai_connector: AIConnector instance
+        prompt: Prompt for AI model
+        sql_parser: SQLParser used to detect a completed SQL block
+
+    Returns:
+        str: AI response received so far
+
+    Note:
+        Reading stops as soon as a complete ```sql``` block has arrived,
+        so trailing explanations from verbose models are not waited for.
+    """
+    placeholder = st.empty()
+    ai_response = ""
+    stream = ai_connector.generate_stream(prompt)
+    try:
+        for chunk in stream:
+            ai_response += chunk
+            placeholder.code(ai_response, language="sql")
+            if sql_parser.has_complete_sql_block(ai_response):
+                break
+    finally:
+        stream.close()
+        placeholder.empty()
+    return ai_response
+
+
+def prompt_fingerprint(provider: str, model: str, prompt: str) -> str:
+    """
+    Compute cache key for an AI request.
+
+    Args:
+        provider: AI provider name
+        model: Model name
+        prompt: Prompt sent to the model
+
+    Returns:
+        str: SHA-256 hex digest identifying the request
+    """
+    key = f"{provider}\0{model}\0{prompt}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+@st.cache_resource
+def get_ai_response_cache() -> Tuple["OrderedDict[str, str]", threading.Lock]:
+    """
+    Get the AI response cache shared across sessions.
+
+    Returns:
+        Tuple of (LRU cache of prompt key -> AI response, lock guarding it)
+
+    Note:
+        Held as a resource so the same question asked from different
+        sessions reuses one inference. Sessions run on separate threads,
+        hence the lock.
+    """
+    return OrderedDict(), threading.Lock()
+
+
+def get_cached_ai_response(prompt_key: str) -> Optional[str]:
+    """
+    Look up a cached AI response.
+
+    Args:
+        prompt_key: Key from prompt_fingerprint()
+
+    Returns:
+        Cached AI response, or None if not cached
+    """
+    cache, lock = get_ai_response_cache()
+    with lock:
+        if prompt_key not in cache:
+            return None
+        cache.move_to_end(prompt_key)
+        return cache[prompt_key]
+
+
+def cache_ai_response(prompt_key: str, ai_response: str) -> None:
+    """
+    Store an AI response in the shared cache (LRU).
+
+    Args:
+        prompt_key: Key from prompt_fingerprint()
+        ai_response: AI response whose SQL executed successfully
+
+    Note:
+        Responses are generated with temperature 0.0, so an identical
+        prompt can reuse the previous response without a new inference.
+        Only responses whose SQL succeeded are stored.
+    """
+    cache, lock = get_ai_response_cache()
+    with lock:
+        cache[prompt_key] = ai_response
+        cache.move_to_end(prompt_key)
+        while len(cache) > MAX_RESPONSE_CACHE_ENTRIES:
+            cache.popitem(last=False)
+
+
+@st.cache_data(ttl=600, max_entries=16, show_spinner=False)
+def encode_csv(df) -> bytes:
+    """
+    Encode query result as CSV bytes with caching.
+
+    Args:
+        df: Query result DataFrame
+
+    Returns:
+        bytes: UTF-8 encoded CSV (without index)
+
+    Note:
+        Cached by DataFrame content, so an identical result is not
+        serialized again on subsequent runs.
+    """
+    csv_buffer = io.BytesIO()
+    df.to_csv(csv_buffer, index=False, encoding="utf-8")
+    return csv_buffer.getvalue()
+
+
 def start_execution():
     """Sets the execution flag in session state."""
     st.session_state.is_executing = True
@@ -171,18 +470,22 @@ def main():
         st.stop()
         return
 
+    # Schema (TTL付きキャッシュ。期限切れ時のみDBから再取得)
+    try:
+        schema = load_schema(sys["connector"])
+    except Exception as e:
+        st.error(f"❌ スキーマ取得失敗: {e}")
+        st.stop()
+        return
+
     # Sidebar UI
     # Schema viewer button (before settings)
     if st.sidebar.button("📊 スキーマ一覧を表示"):
-        viewer = SchemaViewer(sys["schema"], sys["logical_names"])
+        viewer = get_schema_viewer(schema, sys["logical_names"])
         viewer.show()
 
     # DB connection info display
-    if Config.DB_TYPE == "sqlite":
-        db_info = f"**接続中:** SQLite (`{Config.DB_PATH.name}`)"
-    else:  # mysql
-        db_info = f"**接続中:** MySQL (`{Config.DB_NAME}`)"
-    st.sidebar.info(db_info)
+    st.sidebar.info(sys["db_info"])
 
     st.sidebar.markdown("---")
 
@@ -200,20 +503,19 @@ def main():
             help="Ollama: サーバーが起動していません",
         )
         provider = "Gemini"
+
+        # Re-check Ollama availability (clears cached probe result)
+        if st.sidebar.button("再チェック", help="Ollamaサーバーの起動状態を再確認します"):
+            probe_ollama.clear()
+            st.rerun()
     else:
         provider = st.sidebar.radio("AIプロバイダ", ["Gemini", "Ollama"], index=0)
 
     # Model selection
     if provider == "Gemini":
-        selected_model = st.sidebar.selectbox(
-            "モデル",
-            ["gemini-2.5-flash", "gemini-2.5-pro", "gemini-2.5-flash-lite"],
-            index=0,
-        )
+        selected_model = st.sidebar.selectbox("モデル", GEMINI_MODELS, index=0)
     else:  # Ollama
-        selected_model = st.sidebar.selectbox(
-            "モデル", ["gemma3:12b", "gemma3:27b", "gpt-oss:latest"], index=0
-        )
+        selected_model = st.sidebar.selectbox("モデル", OLLAMA_MODELS, index=0)
 
     # History display toggle
     show_history = st.sidebar.checkbox(
@@ -225,7 +527,7 @@ def main():
     # Clear history button
     if st.sidebar.button("履歴クリア"):
         if "query_history" in st.session_state:
-            st.session_state.query_history = []
+            st.session_state.query_history = deque(maxlen=MAX_HISTORY_ENTRIES)
             st.success("履歴をクリアしました")
 
     # Main area header and query input UI (Task 29)
@@ -233,21 +535,9 @@ def main():
     st.markdown("自然言語でデータベースに問い合わせできます")
 
     # Sample query selection (only for sample DB)
-    is_sample_db = (
-        Config.DB_TYPE == "sqlite" and
-        Config.DB_PATH.name == "restaurant.db"
-    )
-
     selected_sample = ""
-    if is_sample_db:
-        sample_queries = [
-            "",
-            "30代の会員は何人いますか？",
-            "評価4以上のイタリアンレストランを表示",
-            "2025年1月に最も予約が多かった店舗TOP5",
-            "休眠会員（90日以上予約なし）は何人？",
-        ]
-        selected_sample = st.selectbox("サンプル選択（任意）", sample_queries, index=0)
+    if sys["is_sample_db"]:
+        selected_sample = st.selectbox("サンプル選択（任意）", SAMPLE_QUERIES, index=0)
 
     # Text input area
     user_input = st.text_area(
@@ -276,73 +566,87 @@ def main():
 
         # Create AI connector (Task 30)
         try:
-            if provider == "Gemini":
-                ai_connector = create_ai_connector(
-                    "gemini", api_key=Config.GEMINI_API_KEY, model=selected_model
-                )
-            else:  # Ollama
-                ai_connector = create_ai_connector(
-                    "ollama", host=Config.OLLAMA_HOST, model=selected_model
-                )
+            ai_connector = get_ai_connector(provider, selected_model)
         except Exception as e:
             st.error(f"❌ AI接続エラー: {str(e)}")
             st.session_state.is_executing = False
             return
 
+        prompt_gen = get_prompt_generator(
+            schema, sys["logical_names"], sys["business_terms"]
+        )
+
         # Retry loop (Task 33)
         max_retries = Config.MAX_RETRIES
         error_context = None
+        pending_candidates: List[str] = []
+        prompt_key = None
+        ai_response = None
 
         for attempt in range(max_retries):
             try:
-                # Generate prompt (Task 30)
-                prompt = sys["prompt_gen"].generate(user_input, error_context)
-
-                # AI inference
-                with st.spinner(f"🤖 AI推論中... ({attempt + 1}/{max_retries})"):
-                    ai_response = ai_connector.generate(prompt)
-
-                # SQL extraction (Task 31)
-                parse_result = sys["sql_parser"].extract_sql(ai_response)
-
-                # ERROR detection - TEST-F09 (Task 31)
-                if (
-                    not parse_result["success"]
-                    and parse_result.get("error_type") == "invalid_question"
-                ):
-                    error_result = sys["error_handler"].handle_error(
-                        "invalid_question", parse_result.get("error_message", "")
+                if pending_candidates:
+                    # Try next candidate SQL from the previous AI response (no new AI call)
+                    sql = pending_candidates.pop(0)
+                else:
+                    # Generate prompt (Task 30)
+                    prompt = prompt_gen.generate(
+                        user_input, error_context, Config.SQL_CANDIDATES
                     )
-                    st.error(error_result["display_message"])
-                    st.session_state.is_executing = False
-                    return
-
-                # Extraction failed
-                if not parse_result["success"]:
-                    if attempt < max_retries - 1:
-                        st.warning(
-                            f"⚠️ SQL抽出失敗、リトライ中... ({attempt + 1}/{max_retries})"
+
+                    # AI inference (identical prompts reuse the cached response)
+                    prompt_key = prompt_fingerprint(provider, selected_model, prompt)
+                    ai_response = get_cached_ai_response(prompt_key)
+                    if ai_response is None:
+                        with st.spinner(f"🤖 AI推論中... ({attempt + 1}/{max_retries})"):
+                            ai_response = stream_ai_response(
+                                ai_connector, prompt, sys["sql_parser"]
+                            )
+
+                    # SQL extraction (Task 31)
+                    parse_result = sys["sql_parser"].extract_sql(ai_response)
+
+                    # ERROR detection - TEST-F09 (Task 31)
+                    if (
+                        not parse_result["success"]
+                        and parse_result.get("error_type") == "invalid_question"
+                    ):
+                        error_result = sys["error_handler"].handle_error(
+                            "invalid_question", parse_result.get("error_message", "")
                         )
-                        error_context = {
-                            "sql": None,
-                            "error_message": parse_result.get(
-                                "error_message", "SQL抽出失敗"
-                            ),
-                        }
-                        continue
-                    else:
-                        st.error("❌ SQL抽出に失敗しました（リトライ上限）")
+                        st.error(error_result["display_message"])
                         st.session_state.is_executing = False
                         return
 
+                    # Extraction failed
+                    if not parse_result["success"]:
+                        if attempt < max_retries - 1:
+                            st.warning(
+                                f"⚠️ SQL抽出失敗、リトライ中... ({attempt + 1}/{max_retries})"
+                            )
+                            error_context = {
+                                "sql": None,
+                                "error_message": parse_result.get(
+                                    "error_message", "SQL抽出失敗"
+                                ),
+                            }
+                            continue
+                        else:
+                            st.error("❌ SQL抽出に失敗しました（リトライ上限）")
+                            st.session_state.is_executing = False
+                            return
+
+                    sql = parse_result["sql"]
+                    pending_candidates = parse_result.get("candidates", [])[1:]
+
                 # SQL execution
-                sql = parse_result["sql"]
                 st.code(sql, language="sql")
 
                 with st.spinner("⚡ SQL実行中..."):
                     try:
                         df = sys["connector"].execute_query(sql)
                         row_count = len(df)
+                        executed_at = datetime.now()
 
                         # Display success message with row count
                         if row_count >= 1000:
@@ -355,11 +659,10 @@ def main():
                             st.dataframe(df, use_container_width=True)
 
                             # CSV download button
-                            csv = df.to_csv(index=False).encode("utf-8")
                             st.download_button(
                                 label="📥 CSVダウンロード",
-                                data=csv,
-                                file_name=f"query_result_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                                data=encode_csv(df),
+                                file_name=f"query_result_{executed_at:%Y%m%d_%H%M%S}.csv",
                                 mime="text/csv",
                             )
 
@@ -369,12 +672,11 @@ def main():
 
                         # Save to history
                         if "query_history" not in st.session_state:
-                            st.session_state.query_history = []
+                            st.session_state.query_history = deque(maxlen=MAX_HISTORY_ENTRIES)
 
-                        st.session_state.query_history.insert(
-                            0,
+                        st.session_state.query_history.appendleft(
                             {
-                                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                                "timestamp": f"{executed_at:%Y-%m-%d %H:%M:%S}",
                                 "question": user_input,
                                 "sql": sql,
                                 "row_count": row_count,
@@ -382,6 +684,10 @@ def main():
                             },
                         )
 
+                        # Cache AI response that produced working SQL
+                        if prompt_key is not None:
+                            cache_ai_response(prompt_key, ai_response)
+
                         # Success - reset state and break retry loop
                         st.session_state.is_executing = False
                         break
@@ -392,13 +698,7 @@ def main():
 
                         if attempt < max_retries - 1:
                             # Determine if retry should be attempted
-                            error_type = "syntax_error"  # Default
-                            if "禁止操作" in error_message or "許可されていません" in error_message:
-                                error_type = "permission_error"
-                            elif "no such column" in error_message.lower():
-                                error_type = "column_error"
-                            elif "no such table" in error_message.lower():
-                                error_type = "table_error"
+                            error_type = ERROR_TYPES.get(type(e), "syntax_error")
 
                             should_retry = sys["error_handler"].should_retry(error_type)
 
@@ -439,7 +739,7 @@ def main():
     if show_history and "query_history" in st.session_state:
         st.markdown("---")
         st.subheader("📜 クエリ履歴")
-        for i, record in enumerate(st.session_state.query_history[:10]):
+        for i, record in enumerate(islice(st.session_state.query_history, 10)):
             with st.expander(
                 f"{record['timestamp']} - {record['question'][:50]}... ({record['row_count']}件)"
             ):
@@ -1,32 +1,37 @@
 """
 テストデータ生成システム 設定ファイル
+
+実行中の誤変更を防ぐため、辞書は読み取り専用（MappingProxyType）、
+リストはタプルで定義する。
 """
 
+from types import MappingProxyType
+
 # データ量設定（SQLite sample版）
-DATA_VOLUME = {
+DATA_VOLUME = MappingProxyType({
     'members': 1000,
     'restaurants': 200,
     'reservations': 4000,
     'access_logs': 25000,
     'reviews': 400,
     'favorites': 3000
-}
+})
 
 # チャンク分割サイズ（大量データ生成時のメモリ最適化）
 CHUNK_SIZE = 10000  # sample版用に縮小
 
 # パレート法則の比率設定
-PARETO_RATIOS = {
+PARETO_RATIOS = MappingProxyType({
     'member_active_ratio': 0.2,           # 上位アクティブ会員の割合（20%）
     'member_reservation_ratio': 0.8,      # 上位会員が占める予約の割合（80%）
     'restaurant_popular_ratio': 0.1,      # 人気店舗の割合（10%）
     'restaurant_reservation_ratio': 0.5,  # 人気店が占める予約の割合（50%）
     'review_rate': 0.1,                   # 予約からレビュー投稿への転換率（10%）
     'favorite_to_reservation_rate': 0.3   # お気に入りから予約への転換率（30%）
-}
+})
 
 # レストランジャンルリスト
-RESTAURANT_GENRES = [
+RESTAURANT_GENRES = (
     '寿司・海鮮',
     'ラーメン',
     'うどん・そば',
@@ -44,11 +49,11 @@ RESTAURANT_GENRES = [
     'アジア・エスニック',
     'カレー',
     '居酒屋・バー',
-    'カフェ・スイーツ'
-]
+    'カフェ・スイーツ',
+)
 
 # 日付範囲設定
-DATE_RANGES = {
+DATE_RANGES = MappingProxyType({
     'members_registration_years': 10,      # 会員登録: 過去10年以内
     'restaurants_registration_years': 10,  # 店舗登録: 過去10年以内
     'restaurants_min_years_ago': 1,        # 店舗登録: 最低1年前
@@ -56,10 +61,10 @@ DATE_RANGES = {
     'access_logs_months': 6,               # アクセスログ: 過去6ヶ月以内
     'reviews_years': 5,                    # レビュー: 過去5年以内
     'favorites_years': 5                   # お気に入り: 過去5年以内
-}
+})
 
 # 年齢・評価の分布設定
-DISTRIBUTION_CONFIG = {
+DISTRIBUTION_CONFIG = MappingProxyType({
     'age_min': 18,
     'age_max': 80,
     'age_mean': 40,
@@ -68,7 +73,7 @@ DISTRIBUTION_CONFIG = {
     'rating_max': 5,
     'rating_mean': 3.5,
     'rating_std': 0.8
-}
+})
 
 # キャンセル率（visit_dateがNULLになる割合）
 CANCELLATION_RATE = 0.1
@@ -77,11 +82,11 @@ CANCELLATION_RATE = 0.1
 NON_LOGIN_ACCESS_RATE = 0.3
 
 # 出力設定
-OUTPUT_CONFIG = {
+OUTPUT_CONFIG = MappingProxyType({
     'db_path': '../data/restaurant.db',  # SQLite DB出力先
     'log_dir': 'logs',
     'log_file': 'generate_data.log'
-}
+})
 
 # ログレベル
 LOG_LEVEL = 'INFO'  # DEBUG, INFO, WARNING, ERROR, CRITICAL
\ No newline at end of file
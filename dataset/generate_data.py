@@ -10,15 +10,11 @@ import os
 import sys
 import sqlite3
 from datetime import datetime, timedelta
-from typing import List, Tuple
-import uuid
-import random
+from typing import List
 from pathlib import Path
 
-import pandas as pd
 import numpy as np
 from faker import Faker
-from tqdm import tqdm
 
 import config
 
@@ -31,16 +27,18 @@ class SQLiteDataGenerator:
         self.faker = Faker('ja_JP')
         Faker.seed(42)  # 再現性のためのシード固定
         np.random.seed(42)
-        random.seed(42)
 
         self._setup_logging()
         self._create_directories()
         self._init_database()
 
         # 生成済みデータの保持（外部キー参照用）
-        self.member_ids: List[int] = []
-        self.restaurant_ids: List[int] = []
-        self.reservations: List[Tuple[int, int, int]] = []  # (reservation_id, member_id, restaurant_id)
+        self.member_ids = np.empty(0, dtype=np.int32)
+        self.restaurant_ids = np.empty(0, dtype=np.int32)
+        # 予約データは列ごとに配列で保持
+        self.reservation_ids = np.empty(0, dtype=np.int32)
+        self.reservation_member_ids = np.empty(0, dtype=np.int32)
+        self.reservation_restaurant_ids = np.empty(0, dtype=np.int32)
 
         self.logger.info("SQLiteデータ生成システム初期化完了")
 
@@ -77,11 +75,22 @@ class SQLiteDataGenerator:
         self.conn = sqlite3.connect(db_path)
         self.cursor = self.conn.cursor()
 
-        self._create_schema()
+        # 一括投入向け設定（生成途中のDBは破棄して再生成するためクラッシュ耐性は不要）
+        # journal_modeはDBファイルに残らないMEMORYを使用（アプリはREAD ONLYで接続するため）
+        self.cursor.executescript("""
+        PRAGMA page_size = 8192;
+        PRAGMA journal_mode = MEMORY;
+        PRAGMA synchronous = OFF;
+        PRAGMA temp_store = MEMORY;
+        PRAGMA cache_size = -262144;
+        PRAGMA locking_mode = EXCLUSIVE;
+        """)
+
+        self._create_tables()
         self.logger.info(f"SQLite DB初期化完了: {db_path}")
 
-    def _create_schema(self):
-        """テーブルスキーマ作成"""
+    def _create_tables(self):
+        """テーブルスキーマ作成（インデックスはデータ投入後に_create_indexesで作成）"""
         schema_sql = """
         -- 会員マスタ
         CREATE TABLE members (
@@ -145,19 +154,115 @@ class SQLiteDataGenerator:
             row_count INTEGER,
             created_at TEXT DEFAULT CURRENT_TIMESTAMP
         );
-
-        -- インデックス作成
-        CREATE INDEX idx_member_res ON reservations(member_id);
-        CREATE INDEX idx_restaurant_res ON reservations(restaurant_id);
-        CREATE INDEX idx_access_date ON access_logs(access_date);
-        CREATE INDEX idx_review_restaurant ON reviews(restaurant_id);
-        CREATE INDEX idx_favorite_restaurant ON favorites(restaurant_id);
         """
 
         self.cursor.executescript(schema_sql)
         self.conn.commit()
         self.logger.info("テーブルスキーマ作成完了")
 
+    def _create_indexes(self):
+        """インデックス作成（一括投入後にまとめて構築）"""
+        index_sql = [
+            "CREATE INDEX idx_member_res ON reservations(member_id)",
+            "CREATE INDEX idx_restaurant_res ON reservations(restaurant_id)",
+            "CREATE INDEX idx_access_date ON access_logs(access_date)",
+            "CREATE INDEX idx_review_restaurant ON reviews(restaurant_id)",
+            "CREATE INDEX idx_favorite_restaurant ON favorites(restaurant_id)",
+        ]
+
+        for sql in index_sql:
+            self.cursor.execute(sql)
+        self.logger.info("インデックス作成完了")
+
+    @staticmethod
+    def _random_timestamps(start: datetime, end: datetime, count: int) -> np.ndarray:
+        """
+        start〜end間のランダム日時をエポック秒（int64）で一括生成
+
+        Faker.date_time_between() を1件ずつ呼ぶ代わりにNumPyでまとめて生成する。
+        naive datetimeはタイムゾーン変換せず、そのままの時刻で秒に換算する。
+
+        Returns:
+            エポック秒（int64）の配列
+        """
+        start_ts = np.datetime64(start, 's').astype(np.int64)
+        end_ts = np.datetime64(end, 's').astype(np.int64)
+        return np.random.randint(start_ts, end_ts, size=count, dtype=np.int64)
+
+    @staticmethod
+    def _to_iso_strings(timestamps: np.ndarray) -> List[str]:
+        """エポック秒の配列をISO 8601文字列（YYYY-MM-DDTHH:MM:SS）のリストに変換"""
+        return timestamps.astype('datetime64[s]').astype('U19').tolist()
+
+    @staticmethod
+    def _clipped_normal(mean: float, std: float, lower: float, upper: float, count: int) -> np.ndarray:
+        """
+        正規分布の乱数を [lower, upper] に丸めて生成
+
+        clipは生成した配列に対してin-placeで行い、中間配列を作らない。
+        """
+        values = np.random.normal(mean, std, count)
+        np.clip(values, lower, upper, out=values)
+        return values
+
+    @staticmethod
+    def _random_postcodes(count: int) -> List[str]:
+        """
+        郵便番号（NNN-NNNN形式）を一括生成
+
+        Faker.postcode() を1件ずつ呼ぶ代わりに7桁の整数から文字列を組み立てる。
+        """
+        nums = np.random.randint(0, 10_000_000, size=count)
+        upper = np.char.zfill((nums // 10_000).astype(str), 3)
+        lower = np.char.zfill((nums % 10_000).astype(str), 4)
+        return np.char.add(np.char.add(upper, '-'), lower).tolist()
+
+    @staticmethod
+    def _random_uuids(count: int) -> List[str]:
+        """
+        UUID4文字列を一括生成
+
+        uuid.uuid4() を1件ずつ呼ぶ代わりに、乱数バイトを1回で取得して整形する。
+        """
+        raw = np.frombuffer(os.urandom(16 * count), dtype=np.uint8).reshape(count, 16).copy()
+        raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40  # version 4
+        raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80  # RFC 4122 variant
+        hexed = raw.tobytes().hex()
+        return [
+            f"{hexed[i:i + 8]}-{hexed[i + 8:i + 12]}-{hexed[i + 12:i + 16]}-{hexed[i + 16:i + 20]}-{hexed[i + 20:i + 32]}"
+            for i in range(0, 32 * count, 32)
+        ]
+
+    @staticmethod
+    def _pareto_choice(ids: np.ndarray, top_count: int, top_weight: float, count: int) -> np.ndarray:
+        """
+        先頭top_count件をtop_weight倍の重みで選ぶ重み付きサンプリング
+
+        重みは「上位」「その他(1.0)」の2段階のみのため、どちらのグループから
+        選ぶかを一様乱数で決め、グループ内は一様に抽出する。
+
+        Args:
+            ids: 抽出対象のID
+            top_count: 重み付けする上位件数
+            top_weight: 上位の重み
+            count: 抽出件数
+
+        Returns:
+            抽出したIDの配列
+        """
+        size = len(ids)
+        if top_count <= 0 or top_count >= size:
+            return ids[np.random.randint(0, size, size=count)]
+
+        top_total = top_count * top_weight
+        top_mask = np.random.random(count) < top_total / (top_total + (size - top_count))
+        idx = np.where(
+            top_mask,
+            np.random.randint(0, top_count, size=count),
+            np.random.randint(top_count, size, size=count)
+        )
+        return ids[idx]
+
     def generate_members(self):
         """会員マスタ生成"""
         self.logger.info(f"会員データ生成開始: {config.DATA_VOLUME['members']}件")
@@ -166,34 +271,34 @@ class SQLiteDataGenerator:
         count = config.DATA_VOLUME['members']
 
         # データ生成
-        member_ids = list(range(1, count + 1))
-        postal_codes = [self.faker.postcode() for _ in tqdm(range(count), desc="郵便番号生成")]
-        genders = np.random.choice(['M', 'F'], size=count).tolist()
+        member_ids = np.arange(1, count + 1, dtype=np.int32)
+        postal_codes = self._random_postcodes(count)
+        gender_codes = np.random.randint(0, 2, size=count, dtype=np.uint8)
+        genders = np.array(['M', 'F'])[gender_codes].tolist()
 
-        ages = np.random.normal(
+        ages = self._clipped_normal(
             config.DISTRIBUTION_CONFIG['age_mean'],
             config.DISTRIBUTION_CONFIG['age_std'],
+            config.DISTRIBUTION_CONFIG['age_min'],
+            config.DISTRIBUTION_CONFIG['age_max'],
             count
         )
-        ages = np.clip(ages, config.DISTRIBUTION_CONFIG['age_min'], config.DISTRIBUTION_CONFIG['age_max'])
-        ages = ages.astype(int).tolist()
+        ages = ages.astype(np.int8).tolist()
 
         now = datetime.now()
         years_ago = config.DATE_RANGES['members_registration_years']
         start_date = now - timedelta(days=years_ago * 365)
 
-        registration_dates = [
-            self.faker.date_time_between(start_date=start_date, end_date=now).isoformat()
-            for _ in tqdm(range(count), desc="登録日生成")
-        ]
+        registration_dates = self._to_iso_strings(
+            self._random_timestamps(start_date, now, count)
+        )
 
         # SQLite挿入
-        data = list(zip(member_ids, postal_codes, genders, ages, registration_dates))
+        data = zip(member_ids.tolist(), postal_codes, genders, ages, registration_dates)
         self.cursor.executemany(
             "INSERT INTO members VALUES (?, ?, ?, ?, ?)",
             data
         )
-        self.conn.commit()
 
         self.member_ids = member_ids
 
@@ -208,20 +313,23 @@ class SQLiteDataGenerator:
         count = config.DATA_VOLUME['restaurants']
 
         # データ生成
-        restaurant_ids = list(range(1, count + 1))
-
-        def generate_restaurant_name():
-            patterns = [
-                lambda: f"{self.faker.last_name()}{random.choice(['亭', '屋', '家', '処', '庵'])}",
-                lambda: f"{random.choice(['居酒屋', 'レストラン', 'カフェ', 'ダイニング', 'バル'])}{self.faker.last_name()}",
-                lambda: f"{self.faker.last_name()}{random.choice(['台所', '食卓', 'キッチン', '厨房'])}",
-            ]
-            pattern = random.choices(patterns, weights=[45, 35, 20])[0]
-            return pattern()
-
-        names = [generate_restaurant_name() for _ in tqdm(range(count), desc="店名生成")]
+        restaurant_ids = np.arange(1, count + 1, dtype=np.int32)
+
+        # 店名: 「姓+亭」「居酒屋+姓」「姓+台所」の3パターン（45:35:20）
+        last_name_pool = [self.faker.last_name() for _ in range(min(count, 5000))]
+        last_names = np.random.choice(last_name_pool, size=count)
+        pattern_idx = np.random.choice(3, size=count, p=[0.45, 0.35, 0.20])
+        suffixes_a = np.random.choice(['亭', '屋', '家', '処', '庵'], size=count)
+        prefixes_b = np.random.choice(['居酒屋', 'レストラン', 'カフェ', 'ダイニング', 'バル'], size=count)
+        suffixes_c = np.random.choice(['台所', '食卓', 'キッチン', '厨房'], size=count)
+
+        names = np.select(
+            [pattern_idx == 0, pattern_idx == 1],
+            [np.char.add(last_names, suffixes_a), np.char.add(prefixes_b, last_names)],
+            default=np.char.add(last_names, suffixes_c)
+        ).tolist()
         genres = np.random.choice(config.RESTAURANT_GENRES, size=count).tolist()
-        postal_codes = [self.faker.postcode() for _ in tqdm(range(count), desc="郵便番号生成")]
+        postal_codes = self._random_postcodes(count)
 
         now = datetime.now()
         years_ago = config.DATE_RANGES['restaurants_registration_years']
@@ -229,18 +337,16 @@ class SQLiteDataGenerator:
         start_date = now - timedelta(days=years_ago * 365)
         end_date = now - timedelta(days=min_years_ago * 365)
 
-        registration_dates = [
-            self.faker.date_time_between(start_date=start_date, end_date=end_date).isoformat()
-            for _ in tqdm(range(count), desc="登録日生成")
-        ]
+        registration_dates = self._to_iso_strings(
+            self._random_timestamps(start_date, end_date, count)
+        )
 
         # SQLite挿入
-        data = list(zip(restaurant_ids, names, genres, postal_codes, registration_dates))
+        data = zip(restaurant_ids.tolist(), names, genres, postal_codes, registration_dates)
         self.cursor.executemany(
             "INSERT INTO restaurants VALUES (?, ?, ?, ?, ?)",
             data
         )
-        self.conn.commit()
 
         self.restaurant_ids = restaurant_ids
 
@@ -260,49 +366,38 @@ class SQLiteDataGenerator:
 
         self.logger.info(f"パレート分布: 上位{member_active_count}会員、上位{restaurant_popular_count}店舗に偏重")
 
-        # 重み付け
-        member_weights = [10.0 if i < member_active_count else 1.0 for i in range(len(self.member_ids))]
-        member_weights = np.array(member_weights) / np.sum(member_weights)
-
-        restaurant_weights = [20.0 if i < restaurant_popular_count else 1.0 for i in range(len(self.restaurant_ids))]
-        restaurant_weights = np.array(restaurant_weights) / np.sum(restaurant_weights)
-
-        # データ生成
-        reservation_ids = list(range(1, count + 1))
-        member_ids_selected = np.random.choice(self.member_ids, size=count, p=member_weights).tolist()
-        restaurant_ids_selected = np.random.choice(self.restaurant_ids, size=count, p=restaurant_weights).tolist()
+        # データ生成（上位会員は10倍、人気店舗は20倍の重み）
+        reservation_ids = np.arange(1, count + 1, dtype=np.int32)
+        member_ids_selected = self._pareto_choice(self.member_ids, member_active_count, 10.0, count)
+        restaurant_ids_selected = self._pareto_choice(self.restaurant_ids, restaurant_popular_count, 20.0, count)
 
         now = datetime.now()
         years_ago = config.DATE_RANGES['reservations_years']
         start_date = now - timedelta(days=years_ago * 365)
 
-        reservation_dates = [
-            self.faker.date_time_between(start_date=start_date, end_date=now).isoformat()
-            for _ in tqdm(range(count), desc="予約日生成")
-        ]
+        reservation_timestamps = self._random_timestamps(start_date, now, count)
+        reservation_dates = self._to_iso_strings(reservation_timestamps)
 
-        # visit_date（10%はNULL=キャンセル）
-        visit_dates = []
-        cancellation_rate = config.CANCELLATION_RATE
+        # visit_date（予約日の0〜30日後、10%はNULL=キャンセル）
+        cancel_mask = np.random.random(count) < config.CANCELLATION_RATE
+        seconds_ahead = np.random.randint(0, 31, size=count, dtype=np.int64) * 86_400
 
-        for res_date_str in tqdm(reservation_dates, desc="来店日生成"):
-            if random.random() < cancellation_rate:
-                visit_dates.append(None)
-            else:
-                res_date = datetime.fromisoformat(res_date_str)
-                days_ahead = random.randint(0, 30)
-                visit_date = res_date + timedelta(days=days_ahead)
-                visit_dates.append(visit_date.isoformat())
+        visit_timestamps = (reservation_timestamps + seconds_ahead).astype('datetime64[s]')
+        visit_dates = np.where(cancel_mask, None, visit_timestamps.astype('U19')).tolist()
 
         # SQLite挿入
-        data = list(zip(reservation_ids, member_ids_selected, restaurant_ids_selected, reservation_dates, visit_dates))
+        data = zip(
+            reservation_ids.tolist(), member_ids_selected.tolist(), restaurant_ids_selected.tolist(),
+            reservation_dates, visit_dates
+        )
         self.cursor.executemany(
             "INSERT INTO reservations VALUES (?, ?, ?, ?, ?)",
             data
         )
-        self.conn.commit()
 
-        self.reservations = list(zip(reservation_ids, member_ids_selected, restaurant_ids_selected))
+        self.reservation_ids = reservation_ids
+        self.reservation_member_ids = member_ids_selected
+        self.reservation_restaurant_ids = restaurant_ids_selected
 
         elapsed = (datetime.now() - start_time).total_seconds()
         self.logger.info(f"予約データ生成完了: {count}件 ({elapsed:.2f}秒)")
@@ -327,30 +422,28 @@ class SQLiteDataGenerator:
             self.logger.info(f"チャンク {chunk_idx + 1}/{num_chunks} 生成中 ({current_chunk_size}件)")
 
             # データ生成
-            session_ids = [str(uuid.uuid4()) for _ in range(current_chunk_size)]
+            session_ids = self._random_uuids(current_chunk_size)
 
-            non_login_rate = config.NON_LOGIN_ACCESS_RATE
-            member_ids_chunk = []
-            for _ in range(current_chunk_size):
-                if random.random() < non_login_rate:
-                    member_ids_chunk.append(None)
-                else:
-                    member_ids_chunk.append(random.choice(self.member_ids))
+            # member_id（30%はNULL=非ログイン）
+            non_login_mask = np.random.random(current_chunk_size) < config.NON_LOGIN_ACCESS_RATE
+            member_ids_chunk = self.member_ids[
+                np.random.randint(0, len(self.member_ids), size=current_chunk_size)
+            ].astype(object)
+            member_ids_chunk[non_login_mask] = None
+            member_ids_chunk = member_ids_chunk.tolist()
 
             restaurant_ids_chunk = np.random.choice(self.restaurant_ids, size=current_chunk_size).tolist()
 
-            access_dates = [
-                self.faker.date_time_between(start_date=start_date, end_date=now).isoformat()
-                for _ in range(current_chunk_size)
-            ]
+            access_dates = self._to_iso_strings(
+                self._random_timestamps(start_date, now, current_chunk_size)
+            )
 
             # SQLite挿入
-            data = list(zip(session_ids, member_ids_chunk, restaurant_ids_chunk, access_dates))
+            data = zip(session_ids, member_ids_chunk, restaurant_ids_chunk, access_dates)
             self.cursor.executemany(
                 "INSERT INTO access_logs VALUES (?, ?, ?, ?)",
                 data
             )
-            self.conn.commit()
 
             chunk_elapsed = (datetime.now() - chunk_start).total_seconds()
             self.logger.info(f"チャンク {chunk_idx + 1} 完了 ({chunk_elapsed:.2f}秒)")
@@ -366,36 +459,35 @@ class SQLiteDataGenerator:
         count = config.DATA_VOLUME['reviews']
 
         # reservationsからサンプリング
-        sampled_reservations = random.sample(self.reservations, count)
+        sampled_idx = np.random.choice(len(self.reservation_ids), size=count, replace=False)
 
-        review_ids = list(range(1, count + 1))
-        member_ids = [res[1] for res in sampled_reservations]
-        restaurant_ids = [res[2] for res in sampled_reservations]
+        review_ids = np.arange(1, count + 1, dtype=np.int32)
+        member_ids = self.reservation_member_ids[sampled_idx].tolist()
+        restaurant_ids = self.reservation_restaurant_ids[sampled_idx].tolist()
 
-        ratings = np.random.normal(
+        ratings = self._clipped_normal(
             config.DISTRIBUTION_CONFIG['rating_mean'],
             config.DISTRIBUTION_CONFIG['rating_std'],
+            config.DISTRIBUTION_CONFIG['rating_min'],
+            config.DISTRIBUTION_CONFIG['rating_max'],
             count
         )
-        ratings = np.clip(ratings, config.DISTRIBUTION_CONFIG['rating_min'], config.DISTRIBUTION_CONFIG['rating_max'])
-        ratings = np.round(ratings).astype(int).tolist()
+        ratings = np.rint(ratings, out=ratings).astype(np.int8).tolist()
 
         now = datetime.now()
         years_ago = config.DATE_RANGES['reviews_years']
         start_date = now - timedelta(days=years_ago * 365)
 
-        post_dates = [
-            self.faker.date_time_between(start_date=start_date, end_date=now).isoformat()
-            for _ in tqdm(range(count), desc="投稿日生成")
-        ]
+        post_dates = self._to_iso_strings(
+            self._random_timestamps(start_date, now, count)
+        )
 
         # SQLite挿入
-        data = list(zip(review_ids, member_ids, restaurant_ids, ratings, post_dates))
+        data = zip(review_ids.tolist(), member_ids, restaurant_ids, ratings, post_dates)
         self.cursor.executemany(
             "INSERT INTO reviews VALUES (?, ?, ?, ?, ?)",
             data
         )
-        self.conn.commit()
 
         elapsed = (datetime.now() - start_time).total_seconds()
         self.logger.info(f"レビューデータ生成完了: {count}件 ({elapsed:.2f}秒)")
@@ -410,52 +502,60 @@ class SQLiteDataGenerator:
 
         self.logger.info(f"お気に入り→予約転換: {favorite_to_reservation_count}件 / {count}件")
 
-        # 30%はreservationsから（重複除外）
-        favorites_from_reservations = random.sample(self.reservations, min(favorite_to_reservation_count, len(self.reservations)))
-        favorites_pairs_set = set()
-        for res in favorites_from_reservations:
-            pair = (res[1], res[2])  # (member_id, restaurant_id)
-            favorites_pairs_set.add(pair)
+        # (member_id, restaurant_id) を1つの整数キーで表現（int32のIDを掛け合わせるためint64で計算）
+        stride = int(self.restaurant_ids.max()) + 1
 
-        favorites_pairs = list(favorites_pairs_set)
+        # 30%はreservationsから（重複除外）
+        sampled_idx = np.random.choice(
+            len(self.reservation_ids),
+            size=min(favorite_to_reservation_count, len(self.reservation_ids)),
+            replace=False
+        )
+        reservation_keys = np.unique(
+            self.reservation_member_ids[sampled_idx].astype(np.int64) * stride
+            + self.reservation_restaurant_ids[sampled_idx]
+        )
 
-        # 残り70%はランダム生成（重複回避）
-        existing_pairs = set(favorites_pairs)
-        max_attempts = count * 10  # 無限ループ防止
-        attempts = 0
+        # 残り70%はランダム生成（多めに一括抽出して重複除外、不足時は抽出数を増やして再試行）
+        need = max(count - len(reservation_keys), 0)
+        member_ids_arr = self.member_ids.astype(np.int64)
+        restaurant_ids_arr = self.restaurant_ids.astype(np.int64)
 
-        while len(favorites_pairs) < count and attempts < max_attempts:
-            member_id = random.choice(self.member_ids)
-            restaurant_id = random.choice(self.restaurant_ids)
-            pair = (member_id, restaurant_id)
+        random_keys = np.empty(0, dtype=np.int64)
+        batch_size = 2 * need
+        for _ in range(5):  # 無限ループ防止
+            if len(random_keys) >= need:
+                break
+            members = member_ids_arr[np.random.randint(0, len(member_ids_arr), size=batch_size)]
+            restaurants = restaurant_ids_arr[np.random.randint(0, len(restaurant_ids_arr), size=batch_size)]
+            candidates = np.concatenate([random_keys, members * stride + restaurants])
+            candidates = candidates[~np.isin(candidates, reservation_keys)]
+            _, first_idx = np.unique(candidates, return_index=True)
+            random_keys = candidates[np.sort(first_idx)]
+            batch_size *= 2
 
-            if pair not in existing_pairs:
-                favorites_pairs.append(pair)
-                existing_pairs.add(pair)
-            attempts += 1
+        favorite_keys = np.concatenate([reservation_keys, random_keys[:need]])
 
-        if len(favorites_pairs) < count:
-            self.logger.warning(f"お気に入り生成: 目標{count}件に対し{len(favorites_pairs)}件生成（重複回避制限）")
+        if len(favorite_keys) < count:
+            self.logger.warning(f"お気に入り生成: 目標{count}件に対し{len(favorite_keys)}件生成（重複回避制限）")
 
-        member_ids = [pair[0] for pair in favorites_pairs]
-        restaurant_ids = [pair[1] for pair in favorites_pairs]
+        member_ids = (favorite_keys // stride).tolist()
+        restaurant_ids = (favorite_keys % stride).tolist()
 
         now = datetime.now()
         years_ago = config.DATE_RANGES['favorites_years']
         start_date = now - timedelta(days=years_ago * 365)
 
-        registration_dates = [
-            self.faker.date_time_between(start_date=start_date, end_date=now).isoformat()
-            for _ in tqdm(range(count), desc="登録日生成")
-        ]
+        registration_dates = self._to_iso_strings(
+            self._random_timestamps(start_date, now, count)
+        )
 
         # SQLite挿入
-        data = list(zip(member_ids, restaurant_ids, registration_dates))
+        data = zip(member_ids, restaurant_ids, registration_dates)
         self.cursor.executemany(
             "INSERT INTO favorites VALUES (?, ?, ?)",
             data
         )
-        self.conn.commit()
 
         elapsed = (datetime.now() - start_time).total_seconds()
         self.logger.info(f"お気に入りデータ生成完了: {count}件 ({elapsed:.2f}秒)")
@@ -480,6 +580,13 @@ class SQLiteDataGenerator:
             self.generate_reviews()
             self.generate_favorites()
 
+            # Phase 3: インデックス作成
+            self.logger.info("Phase 3: インデックス作成")
+            self._create_indexes()
+
+            # 全データを1トランザクションでコミット
+            self.conn.commit()
+
             total_elapsed = (datetime.now() - total_start).total_seconds()
 
             # DB統計情報
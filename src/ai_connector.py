@@ -6,9 +6,11 @@ using the Strategy Pattern.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict
+from typing import Dict, Iterator, Optional
+import json
 import google.generativeai as genai
 import requests
+from requests.adapters import HTTPAdapter
 
 
 class AIConnector(ABC):
@@ -34,6 +36,24 @@ class AIConnector(ABC):
         """
         pass
 
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Generate AI response from prompt as a stream of text chunks.
+
+        The default implementation yields the full response of generate()
+        as a single chunk. Connectors that support streaming override it.
+
+        Args:
+            prompt: Input prompt for AI model
+
+        Yields:
+            Text chunks of the AI response in order
+
+        Raises:
+            Exception: If AI generation fails
+        """
+        yield self.generate(prompt)
+
 
 class GeminiConnector(AIConnector):
     """Gemini API connector for Text-to-SQL generation."""
@@ -48,6 +68,10 @@ class GeminiConnector(AIConnector):
         """
         genai.configure(api_key=api_key)
         self.model = genai.GenerativeModel(model_name)
+        self.generation_config = {
+            "temperature": 0.0,
+            "max_output_tokens": 2048,
+        }
 
     def generate(self, prompt: str) -> str:
         """
@@ -59,19 +83,39 @@ class GeminiConnector(AIConnector):
         Returns:
             Generated SQL or ERROR response
 
+        Raises:
+            Exception: If API call fails or times out
+
+        Note:
+            Built on generate_stream() so both paths share one request
+            implementation.
+        """
+        return "".join(self.generate_stream(prompt))
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Generate SQL from prompt using Gemini streaming API.
+
+        Args:
+            prompt: Input prompt for SQL generation
+
+        Yields:
+            Text chunks of the response as they arrive
+
         Raises:
             Exception: If API call fails or times out
         """
         try:
             response = self.model.generate_content(
                 prompt,
-                generation_config={
-                    "temperature": 0.0,
-                    "max_output_tokens": 2048,
-                },
+                generation_config=self.generation_config,
                 request_options={"timeout": 120},
+                stream=True,
             )
-            return response.text
+            for chunk in response:
+                # Chunks without text parts (e.g. finish marker) are skipped
+                if chunk.parts:
+                    yield chunk.text
         except Exception as e:
             raise Exception(f"Gemini API error: {str(e)}")
 
@@ -79,17 +123,29 @@ class GeminiConnector(AIConnector):
 class OllamaConnector(AIConnector):
     """Ollama API connector for Text-to-SQL generation."""
 
-    def __init__(self, host: str, model: str) -> None:
+    def __init__(
+        self, host: str, model: str, session: Optional[requests.Session] = None
+    ) -> None:
         """
         Initialize Ollama connector.
 
         Args:
             host: Ollama server URL (e.g., http://localhost:11434)
             model: Model name (e.g., gemma3:12b)
+            session: HTTP session to share with other callers (optional).
+                A dedicated keep-alive session is created if omitted.
         """
         self.endpoint = f"{host}/api/generate"
         self.model = model
 
+        # Keep-alive connection pool (reused across generate() calls)
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+        self.session = session
+
     def generate(self, prompt: str) -> str:
         """
         Generate SQL from prompt using Ollama API.
@@ -102,22 +158,73 @@ class OllamaConnector(AIConnector):
 
         Raises:
             Exception: If API call fails or times out
+
+        Note:
+            Built on generate_stream() so both paths share one request
+            implementation.
+        """
+        return "".join(self.generate_stream(prompt))
+
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """
+        Generate SQL from prompt using Ollama streaming API.
+
+        Args:
+            prompt: Input prompt for SQL generation
+
+        Yields:
+            Text chunks of the response as they arrive
+
+        Raises:
+            Exception: If API call fails or times out
+
+        Note:
+            Closing the generator early closes the HTTP response, which
+            stops the generation on the Ollama server.
         """
+        response = None
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
-                json={
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {"temperature": 0.0, "num_predict": 2048},
-                },
+                json=self._build_payload(prompt),
                 timeout=120,
+                stream=True,
             )
             response.raise_for_status()
-            return response.json()["response"]
+
+            # NDJSON: one JSON object per line
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if "error" in data:
+                    raise RuntimeError(data["error"])
+                if data.get("response"):
+                    yield data["response"]
+                if data.get("done"):
+                    break
         except Exception as e:
             raise Exception(f"Ollama API error: {str(e)}")
+        finally:
+            if response is not None:
+                response.close()
+
+    def _build_payload(self, prompt: str) -> Dict:
+        """
+        Build streaming request payload for /api/generate.
+
+        Args:
+            prompt: Input prompt for SQL generation
+
+        Returns:
+            Request JSON payload
+        """
+        return {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True,
+            "options": {"temperature": 0.0, "num_predict": 2048},
+        }
 
 
 def create_ai_connector(provider: str, **kwargs) -> AIConnector:
@@ -128,7 +235,7 @@ def create_ai_connector(provider: str, **kwargs) -> AIConnector:
         provider: Provider name ('gemini' or 'ollama')
         **kwargs: Provider-specific parameters
             - For Gemini: api_key (required), model (optional)
-            - For Ollama: host (required), model (required)
+            - For Ollama: host (required), model (required), session (optional)
 
     Returns:
         AIConnector instance
@@ -145,6 +252,8 @@ def create_ai_connector(provider: str, **kwargs) -> AIConnector:
             kwargs["api_key"], kwargs.get("model", "gemini-2.5-flash")
         )
     elif provider == "ollama":
-        return OllamaConnector(kwargs["host"], kwargs["model"])
+        return OllamaConnector(
+            kwargs["host"], kwargs["model"], kwargs.get("session")
+        )
     else:
         raise ValueError(f"未対応のプロバイダ: {provider}")
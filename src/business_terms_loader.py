@@ -6,8 +6,18 @@ JSON Linesファイルから読み込むモジュール。
 """
 
 import json
+import logging
+import os
+import re
 from typing import List, Dict, Optional
-from pathlib import Path
+
+try:
+    # orjsonがあれば高速パーサを使用（オプション依存）
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+logger = logging.getLogger(__name__)
 
 
 class BusinessTermsLoader:
@@ -25,6 +35,11 @@ class BusinessTermsLoader:
         "あなたの役割", "代わりに", "最優先"
     ]
 
+    # 禁止ワード検出用の正規表現（大文字小文字を区別しない）
+    PROHIBITED_PATTERN = re.compile(
+        "|".join(map(re.escape, PROHIBITED_WORDS)), re.IGNORECASE
+    )
+
     # 最大用語数（パフォーマンス保護）
     MAX_TERMS = 200
 
@@ -52,60 +67,64 @@ class BusinessTermsLoader:
         """
         try:
             # ファイル存在確認
-            if not Path(file_path).exists():
+            if not os.path.exists(file_path):
                 raise FileNotFoundError(f"ファイルが見つかりません: {file_path}")
 
             terms = []
+            reached_limit = False
 
-            # JSON Lines読み込み（UTF-8）
+            # JSON Lines読み込み（UTF-8、ファイル全体を1回で読み込んでデコード）
             try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    for line_num, line in enumerate(f, start=1):
-                        line = line.strip()
-
-                        # 空行スキップ
-                        if not line:
-                            continue
-
-                        # JSON解析
-                        try:
-                            data = json.loads(line)
-                        except json.JSONDecodeError as e:
-                            raise ValueError(
-                                f"{line_num}行目: JSON解析エラー: {e}\n"
-                                "各行が正しいJSON形式か確認してください。"
-                            )
-
-                        # 必須キー検証
-                        if "term" not in data or "definition" not in data:
-                            raise ValueError(
-                                f"{line_num}行目: 必須キー不足 (term, definition)\n"
-                                f"現在のキー: {set(data.keys())}"
-                            )
-
-                        term_text = str(data["term"]).strip()
-                        definition_text = str(data["definition"]).strip()
-
-                        # 空値チェック
-                        if not term_text or not definition_text:
-                            # 空値の行はスキップ（警告なし）
-                            continue
-
-                        # 禁止ワード検証（セキュリティ対策: プロンプトインジェクション防止）
-                        has_prohibited = False
-                        for word in BusinessTermsLoader.PROHIBITED_WORDS:
-                            if word.lower() in term_text.lower() or word.lower() in definition_text.lower():
-                                # 禁止ワード検出時は行をスキップ（警告はStreamlit側で表示）
-                                has_prohibited = True
-                                break
-
-                        if has_prohibited:
-                            continue
-
-                        terms.append({
-                            "term": term_text,
-                            "definition": definition_text
-                        })
+                with open(file_path, 'rb') as f:
+                    content = f.read().decode('utf-8')
+
+                for line_num, line in enumerate(content.split('\n'), start=1):
+                    line = line.strip()
+
+                    # 空行スキップ
+                    if not line:
+                        continue
+
+                    # JSON解析
+                    try:
+                        data = json_loads(line)
+                    except json.JSONDecodeError as e:
+                        raise ValueError(
+                            f"{line_num}行目: JSON解析エラー: {e}\n"
+                            "各行が正しいJSON形式か確認してください。"
+                        )
+
+                    # 必須キー検証
+                    if "term" not in data or "definition" not in data:
+                        raise ValueError(
+                            f"{line_num}行目: 必須キー不足 (term, definition)\n"
+                            f"現在のキー: {set(data.keys())}"
+                        )
+
+                    term_text = str(data["term"]).strip()
+                    definition_text = str(data["definition"]).strip()
+
+                    # 空値チェック
+                    if not term_text or not definition_text:
+                        # 空値の行はスキップ（警告なし）
+                        continue
+
+                    # 禁止ワード検証（セキュリティ対策: プロンプトインジェクション防止）
+                    # 禁止ワード検出時は行をスキップ（警告はStreamlit側で表示）
+                    if (BusinessTermsLoader.PROHIBITED_PATTERN.search(term_text)
+                            or BusinessTermsLoader.PROHIBITED_PATTERN.search(definition_text)):
+                        continue
+
+                    terms.append({
+                        "term": term_text,
+                        "definition": definition_text
+                    })
+
+                    # 200件上限（警告のみ、エラーにしない）
+                    # 上限到達後の行は解析せず、最初の200件のみ使用
+                    if len(terms) >= BusinessTermsLoader.MAX_TERMS:
+                        reached_limit = True
+                        break
 
             except UnicodeDecodeError:
                 raise ValueError(
@@ -113,10 +132,11 @@ class BusinessTermsLoader:
                     "UTF-8形式で保存してください。"
                 )
 
-            # 200件上限チェック（警告のみ、エラーにしない）
-            if len(terms) > BusinessTermsLoader.MAX_TERMS:
-                # 最初の200件のみ使用（Streamlit側で警告表示）
-                terms = terms[:BusinessTermsLoader.MAX_TERMS]
+            if reached_limit:
+                logger.warning(
+                    "ビジネス用語が上限%d件に達したため以降の行は読み込みません: %s",
+                    BusinessTermsLoader.MAX_TERMS, file_path
+                )
 
             return terms
 
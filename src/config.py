@@ -4,55 +4,104 @@ Configuration management module for natural2sql application.
 This module handles loading and validating environment variables and application settings.
 """
 
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Union
+from typing import Any, Callable, Dict, Optional, Tuple, Union
 from dotenv import load_dotenv
 import os
 import logging
 import sys
 
-# Load environment variables from .env file
-# Explicitly specify .env path (project root)
-# .env file takes precedence over system environment variables
-env_path = Path(__file__).parent.parent / ".env"
-load_dotenv(dotenv_path=env_path, override=True)
+# .env file path (project root)
+ENV_PATH = Path(__file__).parent.parent / ".env"
 
-# Configure logging
+# Log directory
 LOG_DIR = Path(__file__).parent.parent / "logs"
-LOG_DIR.mkdir(exist_ok=True)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_DIR / 'natural2sql.log'),
+logger = logging.getLogger(__name__)
+
+_bootstrapped = False
+
+
+def _bootstrap_once() -> None:
+    """
+    .envの読み込みとログ設定を初回のみ実行
+
+    importしただけでは.envのパースやログファイルのオープンを行わず、
+    最初に設定値が参照された時点で実行する。
+    .envの値はシステム環境変数より優先される。
+    """
+    global _bootstrapped
+    if _bootstrapped:
+        return
+    _bootstrapped = True
+
+    load_dotenv(dotenv_path=ENV_PATH, override=True)
+
+    # ルートロガーに既存ハンドラがあれば追加しない（重複書き込み防止）
+    root = logging.getLogger()
+    if root.hasHandlers():
+        return
+
+    if not os.path.isdir(LOG_DIR):
+        os.makedirs(LOG_DIR, exist_ok=True)
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    # delay=True: 最初のログ出力時までログファイルをオープンしない
+    handlers = [
+        logging.FileHandler(LOG_DIR / 'natural2sql.log', delay=True),
         logging.StreamHandler(sys.stderr)
     ]
-)
-
-logger = logging.getLogger(__name__)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+        root.addHandler(handler)
+    root.setLevel(logging.INFO)
 
 
-def _parse_db_port() -> int:
+def _parse_db_port(value: str) -> int:
     """
     DB_PORT環境変数を安全に解析（無効値は3306にフォールバック）
 
+    Args:
+        value: DB_PORTの値
+
     Returns:
         int: ポート番号（デフォルト: 3306）
     """
-    port_str = os.getenv("DB_PORT", "3306")
     try:
-        return int(port_str)
+        return int(value)
     except ValueError:
         return 3306
 
 
-class Config:
+class _LazyEnvConfig(type):
+    """
+    環境変数由来の設定値を初回アクセス時に解決するメタクラス
+
+    いずれかの設定値が最初に参照された時点で_ENV_SPECの全項目を
+    os.environから一括で読み込み、クラス属性として保持する。
+    2回目以降は通常の属性参照になる。
+    """
+
+    def __getattr__(cls, name: str) -> Any:
+        if name not in cls._ENV_SPEC:
+            raise AttributeError(f"type object '{cls.__name__}' has no attribute '{name}'")
+
+        _bootstrap_once()
+        env = os.environ
+        for attr, (env_name, default, cast) in cls._ENV_SPEC.items():
+            # 未設定・空文字はデフォルト値を使用
+            raw = env.get(env_name)
+            setattr(cls, attr, cast(raw) if raw else default)
+        return cls.__dict__[name]
+
+
+class Config(metaclass=_LazyEnvConfig):
     """
     Application configuration class.
 
     Loads configuration from environment variables and provides validation methods.
     All paths are absolute and validated during initialization.
+    Environment-derived settings are read on first access (see _ENV_SPEC).
     """
 
     # Base directories
@@ -61,37 +110,62 @@ class Config:
     DB_PATH: Path = DATA_DIR / "restaurant.db"
 
     # Gemini API configuration
-    GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
+    GEMINI_API_KEY: str
 
     # Ollama configuration
-    OLLAMA_HOST: str = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
-    OLLAMA_MODEL: str = os.getenv("OLLAMA_MODEL", "gemma3:12b")
+    OLLAMA_HOST: str
+    OLLAMA_MODEL: str
 
     # Application settings
-    AI_TIMEOUT: int = int(os.getenv("AI_TIMEOUT_SECONDS", "120"))
-    MAX_RETRIES: int = int(os.getenv("MAX_RETRY_COUNT", "3"))
-    SQL_TIMEOUT: int = int(os.getenv("SQL_TIMEOUT_SECONDS", "30"))
-    MAX_DISPLAY_ROWS: int = int(os.getenv("PREVIEW_LIMIT", "10"))
+    AI_TIMEOUT: int
+    MAX_RETRIES: int
+    SQL_TIMEOUT: int
+    MAX_DISPLAY_ROWS: int
+    SQL_CANDIDATES: int
 
     # Database configuration (v1.1)
-    DB_TYPE: str = os.getenv("DB_TYPE", "sqlite")
+    DB_TYPE: str  # normalized to lower case
+    SUPPORTED_DB_TYPES = frozenset({"sqlite", "mysql"})
 
     # MySQL connection settings
-    DB_HOST: str = os.getenv("DB_HOST", "localhost")
-    DB_PORT: int = _parse_db_port()
-    DB_USER: str = os.getenv("DB_USER", "")
-    DB_PASSWORD: str = os.getenv("DB_PASSWORD", "")
-    DB_NAME: str = os.getenv("DB_NAME", "")
+    DB_HOST: str
+    DB_PORT: int
+    DB_USER: str
+    DB_PASSWORD: str
+    DB_NAME: str
 
     # File paths (optional)
-    LOGICAL_NAMES_PATH: Optional[str] = os.getenv("LOGICAL_NAMES_PATH")
-    BUSINESS_TERMS_PATH: Optional[str] = os.getenv("BUSINESS_TERMS_PATH")
+    LOGICAL_NAMES_PATH: Optional[str]
+    BUSINESS_TERMS_PATH: Optional[str]
+
+    # Environment-derived settings: attribute -> (env var, default, caster)
+    _ENV_SPEC: Dict[str, Tuple[str, Any, Callable[[str], Any]]] = {
+        "GEMINI_API_KEY": ("GEMINI_API_KEY", "", str),
+        "OLLAMA_HOST": ("OLLAMA_BASE_URL", "http://localhost:11434", str),
+        "OLLAMA_MODEL": ("OLLAMA_MODEL", "gemma3:12b", str),
+        "AI_TIMEOUT": ("AI_TIMEOUT_SECONDS", 120, int),
+        "MAX_RETRIES": ("MAX_RETRY_COUNT", 3, int),
+        "SQL_TIMEOUT": ("SQL_TIMEOUT_SECONDS", 30, int),
+        "MAX_DISPLAY_ROWS": ("PREVIEW_LIMIT", 10, int),
+        "SQL_CANDIDATES": ("SQL_CANDIDATE_COUNT", 1, lambda v: max(1, int(v))),
+        "DB_TYPE": ("DB_TYPE", "sqlite", lambda v: v.strip().lower()),
+        "DB_HOST": ("DB_HOST", "localhost", str),
+        "DB_PORT": ("DB_PORT", 3306, _parse_db_port),
+        "DB_USER": ("DB_USER", "", str),
+        "DB_PASSWORD": ("DB_PASSWORD", "", str),
+        "DB_NAME": ("DB_NAME", "", str),
+        "LOGICAL_NAMES_PATH": ("LOGICAL_NAMES_PATH", None, str),
+        "BUSINESS_TERMS_PATH": ("BUSINESS_TERMS_PATH", None, str),
+    }
 
     @classmethod
+    @lru_cache(maxsize=16)
     def resolve_path(cls, path_input: Union[str, Path]) -> Path:
         """
         相対パス・絶対パス両対応のパス解決
 
+        同一入力の解決結果はキャッシュされる（BASE_DIRは不変のため）。
+
         Args:
             path_input: パス文字列またはPathオブジェクト
 
@@ -121,16 +195,16 @@ class Config:
             )
 
         # Validate database configuration based on DB_TYPE
-        if cls.DB_TYPE.lower() == "sqlite":
+        if cls.DB_TYPE == "sqlite":
             # Validate SQLite database path
             db_path = cls.resolve_path(cls.DB_PATH)
-            if not db_path.exists():
+            if not os.path.exists(db_path):
                 raise FileNotFoundError(
                     f"データベースファイルが見つかりません: {db_path}\n"
                     f"期待される場所: {db_path.absolute()}"
                 )
 
-        elif cls.DB_TYPE.lower() == "mysql":
+        elif cls.DB_TYPE == "mysql":
             # Validate MySQL connection settings
             if not cls.DB_HOST:
                 raise ValueError(
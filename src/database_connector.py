@@ -6,11 +6,96 @@
 適切なConnectorインスタンスを生成するFactory関数を定義します。
 """
 
+import re
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List
 import pandas as pd
 
 
+# 禁止SQLキーワード（Layer 1 セキュリティ、全Connector/SQLExecutor共通）
+FORBIDDEN_SQL_PATTERNS = [
+    "INSERT",
+    "UPDATE",
+    "DELETE",
+    "DROP",
+    "CREATE",
+    "ALTER",
+    "TRUNCATE",
+    "PRAGMA",
+    "ATTACH",
+    "DETACH",
+    "VACUUM",
+    "REINDEX",
+]
+
+# FORBIDDEN_SQL_PATTERNSの一括判定用（単語単位で照合し、CREATED_AT等の識別子は対象外）
+FORBIDDEN_SQL_RE = re.compile(
+    r"\b(" + "|".join(FORBIDDEN_SQL_PATTERNS) + r")\b", re.IGNORECASE
+)
+
+# 文字列リテラル（''はエスケープされた引用符）とコメント
+# キーワード・文の判定前にマスクし、その中身をSQLとして扱わないようにする
+SQL_LITERAL_OR_COMMENT_RE = re.compile(r"'(?:[^']|'')*'|--[^\n]*|/\*.*?\*/", re.DOTALL)
+
+# LIMITキーワード（トップレベルかどうかはhas_top_level_limitで判定）
+LIMIT_KEYWORD_RE = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
+
+def has_top_level_limit(sql: str) -> bool:
+    """
+    括弧の外（トップレベル）にLIMIT句があるかを判定
+
+    LIMITはSELECT文の最後の句なので、トップレベルにあれば結果件数は
+    既に制限済みとみなす。LIMITの値は整数に限らず式（LIMIT -1 OFFSET n、
+    LIMIT 2*3、LIMIT (SELECT ...)）でもよい。文字列リテラルとコメントは
+    マスクしてから判定し、サブクエリ内のLIMITは対象外とする。
+
+    Args:
+        sql: 判定対象のSQL文
+
+    Returns:
+        トップレベルにLIMIT句があればTrue
+
+    Example:
+        >>> has_top_level_limit("SELECT * FROM members LIMIT 10")
+        True
+        >>> has_top_level_limit("SELECT * FROM members ORDER BY age LIMIT -1 OFFSET 995")
+        True
+        >>> has_top_level_limit("SELECT * FROM members LIMIT 2*3")
+        True
+        >>> has_top_level_limit("SELECT * FROM members LIMIT (SELECT COUNT(*) FROM stores)")
+        True
+        >>> has_top_level_limit("SELECT * FROM (SELECT * FROM members LIMIT 5)")
+        False
+        >>> has_top_level_limit("SELECT 'LIMIT 5' AS s FROM members -- LIMIT 5")
+        False
+    """
+    code = SQL_LITERAL_OR_COMMENT_RE.sub(" ", sql)
+    for match in LIMIT_KEYWORD_RE.finditer(code):
+        head = code[:match.start()]
+        if head.count("(") == head.count(")"):
+            return True
+    return False
+
+
+class ColumnError(RuntimeError):
+    """
+    存在しないカラムを参照した場合のクエリ実行エラー
+
+    AIによる自動修正（リトライ）の対象。
+    """
+    pass
+
+
+class TableError(RuntimeError):
+    """
+    存在しないテーブルを参照した場合のクエリ実行エラー
+
+    AIによる自動修正（リトライ）の対象。
+    """
+    pass
+
+
 class DatabaseConnector(ABC):
     """
     データベース接続の抽象基底クラス
@@ -60,7 +145,11 @@ class DatabaseConnector(ABC):
             クエリ結果のDataFrame
 
         Raises:
-            Exception: クエリ実行に失敗した場合
+            PermissionError: 禁止操作・書込み操作の場合
+            ColumnError: 存在しないカラムを参照した場合
+            TableError: 存在しないテーブルを参照した場合
+            ValueError: 複数ステートメント等の検証エラー
+            RuntimeError: その他のクエリ実行エラー
         """
         pass
 
@@ -101,12 +190,14 @@ def create_database_connector() -> DatabaseConnector:
         ValueError: If DB_TYPE is invalid or required configuration is missing
     """
     from src.config import Config
-    from src.sqlite_connector import SQLiteConnector
-    from src.mysql_connector import MySQLConnector
 
-    db_type = Config.DB_TYPE.lower()
+    db_type = Config.DB_TYPE
 
+    # Connector modules are imported only for the selected backend, so
+    # mysql.connector is never loaded when running on SQLite
     if db_type == "sqlite":
+        from src.sqlite_connector import SQLiteConnector
+
         db_path = Config.resolve_path(Config.DB_PATH)
         return SQLiteConnector(str(db_path))
 
@@ -118,6 +209,8 @@ def create_database_connector() -> DatabaseConnector:
                 "DB_HOST, DB_USER, DB_NAMEを.envファイルに設定してください。"
             )
 
+        from src.mysql_connector import MySQLConnector
+
         return MySQLConnector(
             host=Config.DB_HOST,
             port=Config.DB_PORT,
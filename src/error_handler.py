@@ -5,6 +5,7 @@ This module provides error classification, user-friendly messages,
 and retry logic for SQL generation and execution errors.
 """
 
+from types import MappingProxyType
 from typing import Dict, Optional
 
 
@@ -19,7 +20,7 @@ class ErrorHandler:
     """
 
     # Error type to user message mapping
-    ERROR_MESSAGES = {
+    ERROR_MESSAGES = MappingProxyType({
         "invalid_question": (
             "❌ この質問はデータベースクエリに変換できません\n\n"
             "💡 レストラン予約データ（会員、店舗、予約、レビュー等）に関する質問をしてください。"
@@ -48,7 +49,23 @@ class ErrorHandler:
             "🔍 SQL抽出失敗\n\n"
             "AI応答からSQLを抽出できませんでした。別の表現でお試しください。"
         ),
-    }
+    })
+
+    # Errors that should trigger retry (documentation only: should_retry
+    # retries everything not in NON_RETRYABLE_ERRORS, so it is not consulted)
+    RETRYABLE_ERRORS = frozenset({
+        "syntax_error",
+        "column_error",
+        "table_error",
+        "extraction_failed",
+    })
+
+    # Errors that should NOT trigger retry
+    NON_RETRYABLE_ERRORS = frozenset({
+        "invalid_question",  # User question is out of scope
+        "timeout_error",  # Retry won't help
+        "permission_error",  # Security restriction
+    })
 
     def __init__(self) -> None:
         """Initialize ErrorHandler."""
@@ -83,10 +100,11 @@ class ErrorHandler:
         )
 
         # Create error context for AI retry
-        error_context = f"エラー種別: {error_type}\n"
+        parts = [f"エラー種別: {error_type}"]
         if sql:
-            error_context += f"実行SQL: {sql}\n"
-        error_context += f"エラー詳細: {error_message}"
+            parts.append(f"実行SQL: {sql}")
+        parts.append(f"エラー詳細: {error_message}")
+        error_context = "\n".join(parts)
 
         return {
             "display_message": display_message,
@@ -106,6 +124,7 @@ class ErrorHandler:
         Retry logic:
             - Retry: syntax_error, column_error, table_error, extraction_failed
             - No retry: invalid_question, timeout_error, permission_error
+            - Unknown error types: retry
 
         Example:
             >>> handler = ErrorHandler()
@@ -114,25 +133,5 @@ class ErrorHandler:
             >>> handler.should_retry('invalid_question')
             False
         """
-        # Errors that should trigger retry
-        retryable_errors = [
-            "syntax_error",
-            "column_error",
-            "table_error",
-            "extraction_failed",
-        ]
-
-        # Errors that should NOT trigger retry
-        non_retryable_errors = [
-            "invalid_question",  # User question is out of scope
-            "timeout_error",  # Retry won't help
-            "permission_error",  # Security restriction
-        ]
-
-        if error_type in retryable_errors:
-            return True
-        elif error_type in non_retryable_errors:
-            return False
-        else:
-            # Unknown error: retry by default
-            return True
+        # Retryable and unknown errors both retry, so one lookup suffices
+        return error_type not in self.NON_RETRYABLE_ERRORS
@@ -5,9 +5,15 @@
 CSVファイルから読み込むモジュール。
 """
 
+import os
+import re
 import pandas as pd
-from typing import Dict, Optional
-from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+
+# 読み込み結果キャッシュ（キー: 絶対パス、値: (更新時刻[ns], ファイルサイズ, マッピング)）
+# パスごとに最新の読み込み結果のみ保持し、ファイル更新時は上書きする
+_CACHE: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
 
 
 class LogicalNamesLoader:
@@ -25,6 +31,11 @@ class LogicalNamesLoader:
         "あなたの役割", "代わりに", "最優先"
     ]
 
+    # 禁止ワード検出用の正規表現（大文字小文字を区別しない）
+    PROHIBITED_PATTERN = re.compile(
+        "|".join(map(re.escape, PROHIBITED_WORDS)), re.IGNORECASE
+    )
+
     @staticmethod
     def load(file_path: str) -> Optional[Dict[str, str]]:
         """
@@ -44,52 +55,75 @@ class LogicalNamesLoader:
             physical_name,logical_name
             member_id,会員ID
             name,氏名
+
+        Note:
+            同一ファイル（パス・更新時刻・サイズが一致）の再読み込みは
+            キャッシュ済みの辞書を返す。返り値は変更しないこと。
         """
         try:
-            # ファイル存在確認
-            if not Path(file_path).exists():
-                raise FileNotFoundError(f"ファイルが見つかりません: {file_path}")
+            # ファイル存在確認（stat結果はキャッシュキーにも使用）
+            try:
+                stat = os.stat(file_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"ファイルが見つかりません: {file_path}") from None
+
+            # キャッシュ確認（ファイル未変更なら再パースしない）
+            key = os.path.abspath(file_path)
+            version = (stat.st_mtime_ns, stat.st_size)
+            cached = _CACHE.get(key)
+            if cached is not None and cached[:2] == version:
+                return cached[2]
+
+            required_cols = ["physical_name", "logical_name"]
 
             # CSV読み込み（UTF-8）
             try:
-                df = pd.read_csv(file_path, encoding='utf-8')
+                # ヘッダー検証（ヘッダー行のみ読み込み）
+                header = pd.read_csv(file_path, nrows=0, encoding='utf-8')
+                if not set(required_cols).issubset(header.columns):
+                    raise ValueError(
+                        f"必須カラム不足: {set(required_cols)}\n"
+                        f"現在のカラム: {set(header.columns)}"
+                    )
+
+                # 必要な2カラムのみを文字列として読み込み（空セルは空文字列）
+                df = pd.read_csv(
+                    file_path,
+                    usecols=required_cols,
+                    dtype=str,
+                    na_filter=False,
+                    encoding='utf-8',
+                    engine='c'
+                )
             except UnicodeDecodeError:
                 raise ValueError(
                     f"ファイルの文字エンコーディングが正しくありません: {file_path}\n"
                     "UTF-8形式で保存してください。"
                 )
 
-            # ヘッダー検証
-            required_cols = {"physical_name", "logical_name"}
-            if not required_cols.issubset(df.columns):
-                raise ValueError(
-                    f"必須カラム不足: {required_cols}\n"
-                    f"現在のカラム: {set(df.columns)}"
-                )
-
-            # NULL/空値処理 & 禁止ワード検証
-            mapping = {}
-            for _, row in df.iterrows():
-                physical = str(row["physical_name"]).strip()
-                logical = str(row["logical_name"]).strip()
-
-                # physical_nameが空の行はスキップ
-                if not physical or physical == "nan":
-                    continue
+            physical = df["physical_name"].str.strip()
+            logical = df["logical_name"].str.strip()
 
-                # logical_nameが空またはnanの場合、physical_nameで代替
-                if not logical or logical == "nan":
-                    logical = physical
+            # physical_nameが空の行はスキップ
+            has_physical = physical.ne("")
+            physical = physical[has_physical]
+            logical = logical[has_physical]
 
-                # 禁止ワード検証（セキュリティ対策: プロンプトインジェクション防止）
-                if any(word.lower() in logical.lower() for word in LogicalNamesLoader.PROHIBITED_WORDS):
-                    raise ValueError(
-                        f"論理名に禁止ワードが含まれています: {physical} -> {logical}\n"
-                        f"禁止ワード: {', '.join(LogicalNamesLoader.PROHIBITED_WORDS)}"
-                    )
+            # logical_nameが空の場合、physical_nameで代替
+            logical = logical.where(logical.ne(""), physical)
 
-                mapping[physical] = logical
+            # 禁止ワード検証（セキュリティ対策: プロンプトインジェクション防止）
+            # 全論理名を改行で連結して1回で走査し、検出時のみ該当行を特定する
+            if LogicalNamesLoader.PROHIBITED_PATTERN.search("\n".join(logical)):
+                prohibited = logical.str.contains(LogicalNamesLoader.PROHIBITED_PATTERN)
+                first = prohibited.idxmax()
+                raise ValueError(
+                    f"論理名に禁止ワードが含まれています: {physical[first]} -> {logical[first]}\n"
+                    f"禁止ワード: {', '.join(LogicalNamesLoader.PROHIBITED_WORDS)}"
+                )
 
+            mapping = dict(zip(physical, logical))
+            _CACHE[key] = (*version, mapping)
             return mapping
 
         except FileNotFoundError:
@@ -103,3 +137,8 @@ class LogicalNamesLoader:
         except Exception as e:
             # 予期しないエラーはValueErrorに変換
             raise ValueError(f"論理名定義ファイルの読み込みに失敗しました: {str(e)}")
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """読み込み結果キャッシュをクリアする"""
+        _CACHE.clear()
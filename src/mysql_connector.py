@@ -5,11 +5,25 @@ This module provides MySQLConnector class that implements DatabaseConnector inte
 for MySQL databases.
 """
 
+import logging
+from decimal import Decimal
+from itertools import groupby
+
 import mysql.connector
 import pandas as pd
-from typing import Dict, Any, List
+from mysql.connector.pooling import MySQLConnectionPool
+from typing import Dict, Any, List, Tuple
+
+from src.database_connector import (
+    FORBIDDEN_SQL_PATTERNS,
+    FORBIDDEN_SQL_RE,
+    ColumnError,
+    DatabaseConnector,
+    TableError,
+    has_top_level_limit,
+)
 
-from src.database_connector import DatabaseConnector
+logger = logging.getLogger(__name__)
 
 
 class MySQLConnector(DatabaseConnector):
@@ -22,21 +36,21 @@ class MySQLConnector(DatabaseConnector):
     - Layer 4: Timeout protection
     """
 
+    # MySQL error codes mapped to typed exceptions
+    ER_BAD_FIELD_ERROR = 1054  # Unknown column
+    ER_NO_SUCH_TABLE = 1146  # Table doesn't exist
+
     # Forbidden SQL patterns (same as SQLiteConnector)
-    FORBIDDEN_PATTERNS = [
-        "INSERT",
-        "UPDATE",
-        "DELETE",
-        "DROP",
-        "CREATE",
-        "ALTER",
-        "TRUNCATE",
-        "PRAGMA",
-        "ATTACH",
-        "DETACH",
-        "VACUUM",
-        "REINDEX",
-    ]
+    FORBIDDEN_PATTERNS = FORBIDDEN_SQL_PATTERNS
+
+    # Rows fetched per round trip when reading query results
+    FETCH_BATCH_SIZE = 256
+
+    # Connection pools shared by all instances, keyed by connection settings.
+    # The pool opens every connection up front and the app keeps a single
+    # cached connector, so one spare only covers a connector being replaced.
+    POOL_SIZE = 2
+    _POOLS: Dict[Tuple[str, int, str, str, str], MySQLConnectionPool] = {}
 
     def __init__(self, host: str, port: int, user: str, password: str, database: str) -> None:
         """
@@ -60,37 +74,66 @@ class MySQLConnector(DatabaseConnector):
         """
         Establish persistent connection to MySQL database.
 
-        Tries utf8mb4 charset first, falls back to utf8 if unsupported.
+        Checks out a connection from a pool shared by connectors with the
+        same settings. The pool is created on first use.
 
         Raises:
             mysql.connector.Error: If connection fails
+            RuntimeError: If every pooled connection is checked out
         """
+        key = (self.host, self.port, self.user, self.password, self.database)
+        pool = self._POOLS.get(key)
+        if pool is None:
+            pool = self._create_pool()
+            self._POOLS[key] = pool
+
         try:
-            self.conn = mysql.connector.connect(
-                host=self.host,
-                port=self.port,
-                user=self.user,
-                password=self.password,
-                database=self.database,
-                charset='utf8mb4',
-                use_unicode=True,
-                connection_timeout=10
+            self.conn = pool.get_connection()
+        except mysql.connector.errors.PoolError as e:
+            raise RuntimeError(
+                f"MySQL接続プールの接続がすべて使用中です（POOL_SIZE={self.POOL_SIZE}）。"
+                f"不要なコネクタをclose()してください: {e}"
+            ) from e
+
+    def _create_pool(self) -> MySQLConnectionPool:
+        """
+        Create connection pool for this connector's settings.
+
+        Uses the C extension for protocol handling when it is installed.
+        Tries utf8mb4 charset first, falls back to utf8 if unsupported.
+
+        Returns:
+            Connection pool
+
+        Raises:
+            mysql.connector.Error: If connection fails
+        """
+        use_pure = not mysql.connector.HAVE_CEXT
+        if use_pure:
+            logger.warning(
+                "mysql-connector C extension is not available; "
+                "falling back to the pure Python implementation"
             )
+
+        options = {
+            "pool_size": self.POOL_SIZE,
+            "host": self.host,
+            "port": self.port,
+            "user": self.user,
+            "password": self.password,
+            "database": self.database,
+            "use_pure": use_pure,
+            "use_unicode": True,
+            "connection_timeout": 10,
+        }
+
+        try:
+            return MySQLConnectionPool(charset='utf8mb4', **options)
         except mysql.connector.Error as e:
             # Fallback to utf8 if utf8mb4 is not supported
             if 'charset' in str(e).lower() or 'character set' in str(e).lower():
-                self.conn = mysql.connector.connect(
-                    host=self.host,
-                    port=self.port,
-                    user=self.user,
-                    password=self.password,
-                    database=self.database,
-                    charset='utf8',
-                    use_unicode=True,
-                    connection_timeout=10
-                )
-            else:
-                raise
+                return MySQLConnectionPool(charset='utf8', **options)
+            raise
 
     def get_schema(self) -> List[Dict[str, Any]]:
         """
@@ -112,31 +155,35 @@ class MySQLConnector(DatabaseConnector):
 
         cursor = self.conn.cursor()
 
-        # Get all table names
-        cursor.execute("SHOW TABLES")
-        tables = [row[0] for row in cursor.fetchall()]
+        # Get column information for all tables in one round trip
+        # (column_type matches the Type field of SHOW COLUMNS, e.g. "int(11)")
+        cursor.execute(
+            "SELECT table_name, column_name, column_type, column_key "
+            "FROM information_schema.columns "
+            "WHERE table_schema = %s "
+            "ORDER BY table_name, ordinal_position",
+            (self.database,)
+        )
+        rows = cursor.fetchall()
+        cursor.close()
 
         schema = []
-        for table in tables:
-            # Get column information for each table
-            cursor.execute(f"SHOW COLUMNS FROM {table}")
-            columns_info = cursor.fetchall()
-
-            columns = []
-            for col in columns_info:
-                # col: (Field, Type, Null, Key, Default, Extra)
-                columns.append({
-                    "column_name": col[0],  # Field
-                    "data_type": col[1],    # Type
-                    "is_primary_key": col[3] == 'PRI'  # Key
-                })
+        for table, table_rows in groupby(rows, key=lambda row: row[0]):
+            # row: (table_name, column_name, column_type, column_key)
+            columns = [
+                {
+                    "column_name": row[1],
+                    "data_type": row[2],
+                    "is_primary_key": row[3] == 'PRI'
+                }
+                for row in table_rows
+            ]
 
             schema.append({
                 "table_name": table,
                 "columns": columns
             })
 
-        cursor.close()
         return schema
 
     def execute_query(self, sql: str, limit: int = 1000) -> pd.DataFrame:
@@ -151,7 +198,11 @@ class MySQLConnector(DatabaseConnector):
             Query results as DataFrame
 
         Raises:
-            Exception: If query execution fails
+            PermissionError: If SQL contains forbidden operations
+            ColumnError: If SQL references an unknown column
+            TableError: If SQL references an unknown table
+            ValueError: If SQL fails other validation checks
+            RuntimeError: If query execution fails for other reasons
 
         Security layers:
             1. Pattern validation (validate_sql)
@@ -164,22 +215,103 @@ class MySQLConnector(DatabaseConnector):
         # Layer 1: Validate SQL
         validation = self.validate_sql(sql)
         if not validation["valid"]:
+            if validation["error_type"] == "forbidden_pattern":
+                raise PermissionError(validation["message"])
             raise ValueError(validation["message"])
 
         # Layer 3: Auto-inject LIMIT clause
         sql_stripped = sql.strip().rstrip(";")
-        if "LIMIT" not in sql_stripped.upper():
+        if not has_top_level_limit(sql_stripped):
             sql_executed = f"{sql_stripped} LIMIT {limit}"
         else:
             sql_executed = sql_stripped
 
         # Execute query
+        cursor = self.conn.cursor(buffered=False)
         try:
-            df = pd.read_sql_query(sql_executed, self.conn)
-            return df
+            cursor.execute(sql_executed)
+            columns = [desc[0] for desc in cursor.description]
+            return self._fetch_dataframe(cursor, columns)
+
+        except mysql.connector.Error as e:
+            self._raise_execution_error(e)
+
+        finally:
+            self._close_cursor(cursor)
 
+    def _close_cursor(self, cursor: Any) -> None:
+        """
+        Close an unbuffered cursor without masking the query's own error.
+
+        If reading stopped partway, the rest of the result is discarded first
+        so the shared connection stays usable for later queries. Errors raised
+        while cleaning up are logged instead of replacing the original one.
+
+        Args:
+            cursor: Unbuffered cursor used by execute_query()
+        """
+        try:
+            if self.conn is not None and self.conn.unread_result:
+                self.conn.consume_results()
+            cursor.close()
         except mysql.connector.Error as e:
-            raise RuntimeError(f"MySQL実行エラー: {str(e)}")
+            logger.warning("Failed to close MySQL cursor: %s", e)
+
+    def _fetch_dataframe(self, cursor: Any, columns: List[str]) -> pd.DataFrame:
+        """
+        Stream result rows in batches into per-column lists.
+
+        Only one batch of row tuples is held at a time, instead of the whole
+        result set as tuples alongside the DataFrame being built.
+
+        Args:
+            cursor: Unbuffered cursor with an executed query
+            columns: Result column names
+
+        Returns:
+            Query results as DataFrame
+        """
+        values: List[List[Any]] = [[] for _ in columns]
+        while True:
+            batch = cursor.fetchmany(self.FETCH_BATCH_SIZE)
+            if not batch:
+                break
+            for column_values, batch_values in zip(values, zip(*batch)):
+                column_values.extend(batch_values)
+
+        if not values or not values[0]:
+            return pd.DataFrame(columns=columns)
+
+        # DECIMAL values (SUM/AVG etc.) become float64, matching the
+        # coerce_float=True default of pd.read_sql_query
+        for index, column_values in enumerate(values):
+            first = next((v for v in column_values if v is not None), None)
+            if isinstance(first, Decimal):
+                values[index] = pd.to_numeric(column_values)
+
+        # Build from positional keys so duplicate column names survive
+        df = pd.DataFrame(dict(enumerate(values)))
+        df.columns = columns
+        return df
+
+    def _raise_execution_error(self, error: Exception) -> None:
+        """
+        Convert MySQL error into typed exception.
+
+        Args:
+            error: Error raised while executing the query
+
+        Raises:
+            ColumnError: Unknown column (1054)
+            TableError: Unknown table (1146)
+            RuntimeError: Other errors
+        """
+        errno = getattr(error, "errno", None)
+        if errno == self.ER_BAD_FIELD_ERROR:
+            raise ColumnError(f"MySQL実行エラー: {str(error)}")
+        elif errno == self.ER_NO_SUCH_TABLE:
+            raise TableError(f"MySQL実行エラー: {str(error)}")
+        raise RuntimeError(f"MySQL実行エラー: {str(error)}")
 
     def validate_sql(self, sql: str) -> Dict[str, Any]:
         """
@@ -199,17 +331,16 @@ class MySQLConnector(DatabaseConnector):
             - Multiple statements (semicolon count)
         """
         # Check forbidden patterns
-        sql_upper = sql.upper()
-        for pattern in self.FORBIDDEN_PATTERNS:
-            if pattern in sql_upper:
-                return {
-                    "valid": False,
-                    "error_type": "forbidden_pattern",
-                    "message": f"禁止操作が含まれています: {pattern}"
-                }
+        match = FORBIDDEN_SQL_RE.search(sql)
+        if match:
+            return {
+                "valid": False,
+                "error_type": "forbidden_pattern",
+                "message": f"禁止操作が含まれています: {match.group(1).upper()}"
+            }
 
-        # Check multiple statements
-        if sql.count(";") > 1:
+        # Check multiple statements (stop at the second semicolon)
+        if sql.find(";", sql.find(";") + 1) != -1:
             return {
                 "valid": False,
                 "error_type": "multiple_statements",
@@ -220,7 +351,7 @@ class MySQLConnector(DatabaseConnector):
 
     def close(self) -> None:
         """
-        Close database connection.
+        Close database connection (returns it to the pool).
         """
         if self.conn:
             self.conn.close()
@@ -5,7 +5,8 @@ This module generates prompts for AI models to convert natural language queries
 into SQL statements, including schema information, logical names, and business terminology.
 """
 
-from typing import Optional, Dict, List, Any
+from functools import cached_property, lru_cache
+from typing import Optional, Dict, List, Any, Tuple
 
 
 class PromptGenerator:
@@ -17,6 +18,59 @@ class PromptGenerator:
     queries into SQL statements.
     """
 
+    # Number of generated prompts memoized per instance
+    PROMPT_CACHE_SIZE = 256
+
+    # System prompt
+    SYSTEM_PROMPT = """あなたはSQLエキスパートです。
+自然言語の質問をSQLクエリに変換してください。
+
+以下のデータベーススキーマを使用してください:"""
+
+    # Important constraints section
+    CONSTRAINTS = """
+
+**重要な制約:**
+- データベースに無関係な質問（天気、ニュース、一般知識等）には、以下の形式で応答してください:
+  ERROR: この質問はデータベースクエリに変換できません
+- SQLite構文を使用してください（MySQL構文は不可）
+- 日付関数: date('now'), date('now', '-30 days') 等を使用
+"""
+
+    # Output format specification (single SQL)
+    OUTPUT_FORMAT = """
+**出力形式:**
+SQLクエリのみを出力してください。説明文は不要です。
+以下のいずれかの形式で出力してください:
+
+1. ```sql で囲む形式:
+```sql
+SELECT * FROM members WHERE age >= 30
+```
+
+2. JSON形式:
+{"sql": "SELECT * FROM members WHERE age >= 30"}
+
+3. 直接SQL文:
+SELECT * FROM members WHERE age >= 30
+"""
+
+    # Output format specification (batch of questions)
+    BATCH_OUTPUT_FORMAT = """
+**出力形式:**
+各質問に対するSQLクエリを、質問番号を付けて以下の形式で出力してください。説明文は不要です。
+データベースに無関係な質問には、番号の後に「ERROR: この質問はデータベースクエリに変換できません」と出力してください。
+
+[1]
+```sql
+SELECT * FROM members WHERE age >= 30
+```
+[2]
+```sql
+SELECT COUNT(*) FROM members WHERE age >= 30
+```
+"""
+
     def __init__(
         self,
         schema: List[Dict[str, Any]],
@@ -37,6 +91,28 @@ class PromptGenerator:
         self.logical_names = logical_names or {}
         self.business_terms = business_terms or []
 
+        # Memoize prompt assembly per instance; a schema change builds a new
+        # generator, so cached prompts never outlive the schema they embed
+        self._build_prompt = lru_cache(maxsize=self.PROMPT_CACHE_SIZE)(self._build_prompt)
+
+    @cached_property
+    def _static_prefix(self) -> str:
+        """
+        Static part of every prompt, built on first use.
+
+        Only the user input and error context vary between prompts, so the
+        system prompt, schema, business terms and constraints are joined once.
+
+        Returns:
+            Prompt prefix string
+        """
+        return (
+            self.SYSTEM_PROMPT
+            + "\n\n" + self._build_schema_section()
+            + self._build_business_section()
+            + self.CONSTRAINTS
+        )
+
     def _build_schema_section(self) -> str:
         """
         Build schema section with logical names integration.
@@ -44,41 +120,60 @@ class PromptGenerator:
         Returns:
             Formatted schema information string
         """
-        schema_lines = []
+        parts = []
+        append = parts.append
+        get_logical_name = self.logical_names.get
 
-        for table in self.schema:
-            table_name = table['table_name']
-            columns = table['columns']
+        for table_index, table in enumerate(self.schema):
+            if table_index:
+                append("\n")
 
             # Build CREATE TABLE statement
-            schema_lines.append(f"CREATE TABLE {table_name} (")
+            append(f"CREATE TABLE {table['table_name']} (\n")
 
-            column_defs = []
-            for col in columns:
+            for col_index, col in enumerate(table['columns']):
                 col_name = col['column_name']
-                col_type = col['data_type']
-                is_pk = col['is_primary_key']
+                if col_index:
+                    append(",\n")
+                append(f"    {col_name} {col['data_type']}")
+                if col['is_primary_key']:
+                    append(" PRIMARY KEY")
 
                 # Add logical name if available
-                logical_name = self.logical_names.get(col_name, "")
+                logical_name = get_logical_name(col_name)
                 if logical_name and logical_name != col_name:
-                    col_def = f"    {col_name} {col_type}"  # 論理名: {logical_name}
-                    if is_pk:
-                        col_def += " PRIMARY KEY"
-                    col_def += f"  -- {logical_name}"
-                else:
-                    col_def = f"    {col_name} {col_type}"
-                    if is_pk:
-                        col_def += " PRIMARY KEY"
+                    append(f"  -- {logical_name}")
 
-                column_defs.append(col_def)
+            append("\n);\n")
 
-            schema_lines.append(",\n".join(column_defs))
-            schema_lines.append(");\n")
+        return "".join(parts)
 
-        return "\n".join(schema_lines)
+    def _build_business_section(self) -> str:
+        """
+        Build business terms section.
 
-    def generate(self, user_input: str, error_context: Optional[Dict] = None) -> str:
+        Returns:
+            Formatted business terms string (empty if no terms)
+        """
+        if not self.business_terms:
+            return ""
+
+        term_lines = "".join(
+            f"- {term}: {definition}\n"
+            for term, definition in (
+                (term_dict.get('term', ''), term_dict.get('definition', ''))
+                for term_dict in self.business_terms
+            )
+            if term and definition
+        )
+        return "\n\n**ビジネス用語の定義:**\n" + term_lines
+
+    def generate(
+        self,
+        user_input: str,
+        error_context: Optional[Dict] = None,
+        num_candidates: int = 1
+    ) -> str:
         """
         Generate a prompt for Text-to-SQL conversion.
 
@@ -86,6 +181,9 @@ class PromptGenerator:
             user_input: Natural language query from user
             error_context: Optional context from previous error (for retry)
                           Contains 'sql' and 'error_message' keys
+            num_candidates: Number of candidate SQL statements to request (default: 1)
+                          If greater than 1, the model is asked to return a JSON
+                          object with a 'candidates' array
 
         Returns:
             Formatted prompt string for AI model
@@ -96,82 +194,99 @@ class PromptGenerator:
             >>> generator = PromptGenerator(schema, logical_names)
             >>> prompt = generator.generate("30代の会員は何人いますか？")
         """
-        # System prompt
-        system_prompt = """あなたはSQLエキスパートです。
-自然言語の質問をSQLクエリに変換してください。
+        error_key = None
+        if error_context:
+            error_key = (
+                error_context.get('sql', 'N/A'),
+                error_context.get('error_message', 'N/A'),
+            )
 
-以下のデータベーススキーマを使用してください:"""
+        return self._build_prompt(user_input, error_key, num_candidates)
 
-        # Schema section with logical names
-        schema_section = "\n\n" + self._build_schema_section()
+    def _build_prompt(
+        self,
+        user_input: str,
+        error_key: Optional[Tuple[Any, Any]],
+        num_candidates: int
+    ) -> str:
+        """
+        Assemble a prompt from hashable arguments (memoized in __init__).
 
-        # Business terms section
-        business_section = ""
-        if self.business_terms:
-            business_section = "\n\n**ビジネス用語の定義:**\n"
-            for term_dict in self.business_terms:
-                term = term_dict.get('term', '')
-                definition = term_dict.get('definition', '')
-                if term and definition:
-                    business_section += f"- {term}: {definition}\n"
+        Args:
+            user_input: Natural language query from user
+            error_key: (sql, error_message) of the previous error, or None
+            num_candidates: Number of candidate SQL statements to request
 
+        Returns:
+            Formatted prompt string for AI model
+        """
         # User input section
         user_section = f"""
 
 ユーザーの質問:
 {user_input}
 
-"""
-
-        # Important constraints section
-        constraints = """
-
-**重要な制約:**
-- データベースに無関係な質問（天気、ニュース、一般知識等）には、以下の形式で応答してください:
-  ERROR: この質問はデータベースクエリに変換できません
-- SQLite構文を使用してください（MySQL構文は不可）
-- 日付関数: date('now'), date('now', '-30 days') 等を使用
 """
 
         # Output format specification
-        output_format = """
+        if num_candidates > 1:
+            output_format = f"""
 **出力形式:**
-SQLクエリのみを出力してください。説明文は不要です。
-以下のいずれかの形式で出力してください:
-
-1. ```sql で囲む形式:
-```sql
-SELECT * FROM members WHERE age >= 30
-```
-
-2. JSON形式:
-{"sql": "SELECT * FROM members WHERE age >= 30"}
+SQLクエリの候補を最大{num_candidates}件、以下のJSON形式で出力してください。説明文は不要です。
+候補は正しい可能性が高い順に並べてください。
 
-3. 直接SQL文:
-SELECT * FROM members WHERE age >= 30
+{{"candidates": ["SELECT * FROM members WHERE age >= 30", "SELECT COUNT(*) FROM members WHERE age >= 30"]}}
 """
+        else:
+            output_format = self.OUTPUT_FORMAT
 
         # Error context section
         error_section = ""
-        if error_context:
+        if error_key:
+            error_sql, error_message = error_key
             error_section = f"""
 
 **前回のエラー情報（修正してください）:**
-- 実行したSQL: {error_context.get('sql', 'N/A')}
-- エラーメッセージ: {error_context.get('error_message', 'N/A')}
+- 実行したSQL: {error_sql}
+- エラーメッセージ: {error_message}
 
 上記のエラーを修正したSQLクエリを生成してください。
 """
 
-        # Construct complete prompt
-        prompt = (
-            system_prompt
-            + schema_section
-            + business_section
-            + constraints
-            + user_section
-            + error_section
-            + output_format
+        # Construct complete prompt (single join: the large prefix is copied once)
+        prompt = "".join(
+            (self._static_prefix, user_section, error_section, output_format)
         )
 
         return prompt
+
+    def batch_generate(self, user_inputs: List[str]) -> str:
+        """
+        Generate a single prompt for multiple questions.
+
+        The schema and business terms are sent once for all questions, and the
+        model is asked to answer each question under its [index] marker.
+        Use SQLParser.batch_extract_sql() to split the response.
+
+        Args:
+            user_inputs: Natural language queries from user
+
+        Returns:
+            Formatted prompt string for AI model
+
+        Example:
+            >>> generator = PromptGenerator(schema)
+            >>> prompt = generator.batch_generate(["30代の会員は何人いますか？", "店舗数は？"])
+        """
+        questions = "\n".join(
+            f"[{i}] {user_input}" for i, user_input in enumerate(user_inputs, start=1)
+        )
+
+        user_section = f"""
+
+ユーザーの質問リスト:
+{questions}
+
+"""
+
+        return self._static_prefix + user_section + self.BATCH_OUTPUT_FORMAT
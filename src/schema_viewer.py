@@ -5,8 +5,9 @@
 論理名定義があれば併記する。
 """
 
+import pandas as pd
 import streamlit as st
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 
 class SchemaViewer:
@@ -34,6 +35,45 @@ class SchemaViewer:
         self.schema = schema
         self.logical_names = logical_names or {}
 
+        # テーブルごとの表示名とカラム一覧DataFrame（構築時に一度だけ作成し、show()で再利用）
+        self._tables = self._build_tables()
+
+    def _build_tables(self) -> List[Tuple[str, pd.DataFrame]]:
+        """
+        テーブル表示名とカラム一覧DataFrameを構築
+
+        Returns:
+            (テーブル表示名, カラム一覧DataFrame) のリスト
+            DataFrameは物理名・論理名・データ型・PKの4カラム
+        """
+        tables = []
+        get_logical_name = self.logical_names.get
+        for table in self.schema:
+            # テーブル論理名を取得
+            table_name = table['table_name']
+            table_logical = get_logical_name(table_name, "")
+
+            # テーブル表示名（論理名があれば併記）
+            if table_logical and table_logical != table_name:
+                table_display = f"**{table_name}** ({table_logical})"
+            else:
+                table_display = f"**{table_name}**"
+
+            # カラム一覧を4カラム形式で構築（物理名・論理名・データ型・PK）
+            # 論理名は別カラムで表示（論理名定義がある場合のみ）
+            columns = table['columns']
+            col_names = [col['column_name'] for col in columns]
+            columns_df = pd.DataFrame({
+                "物理名": col_names,
+                "論理名": [get_logical_name(name, "") for name in col_names],
+                "データ型": [col['data_type'] for col in columns],
+                "PK": ["🔑" if col['is_primary_key'] else "" for col in columns],
+            })
+
+            tables.append((table_display, columns_df))
+
+        return tables
+
     def show(self) -> None:
         """
         スキーマ情報をモーダルダイアログで表示
@@ -46,34 +86,8 @@ class SchemaViewer:
         """
         @st.dialog("📊 データベーススキーマ一覧", width="large")
         def schema_dialog():
-            for table in self.schema:
-                # テーブル論理名を取得
-                table_name = table['table_name']
-                table_logical = self.logical_names.get(table_name, "")
-
-                # テーブル表示名（論理名があれば併記）
-                if table_logical and table_logical != table_name:
-                    table_display = f"**{table_name}** ({table_logical})"
-                else:
-                    table_display = f"**{table_name}**"
-
+            for table_display, columns_df in self._tables:
                 with st.expander(table_display):
-                    # カラム一覧を4カラム形式で表示（物理名・論理名・データ型・PK）
-                    columns_data = []
-                    for col in table['columns']:
-                        col_name = col['column_name']
-                        logical = self.logical_names.get(col_name, "")
-
-                        # 論理名は別カラムで表示（論理名定義がある場合のみ）
-                        pk_mark = "🔑" if col['is_primary_key'] else ""
-
-                        columns_data.append({
-                            "物理名": col_name,
-                            "論理名": logical,
-                            "データ型": col['data_type'],
-                            "PK": pk_mark
-                        })
-
-                    st.table(columns_data)
+                    st.table(columns_df)
 
         schema_dialog()
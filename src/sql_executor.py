@@ -8,6 +8,14 @@ import sqlite3
 from typing import Dict, Any, List
 from pathlib import Path
 
+from src.database_connector import (
+    FORBIDDEN_SQL_PATTERNS,
+    FORBIDDEN_SQL_RE,
+    SQL_LITERAL_OR_COMMENT_RE,
+    has_top_level_limit,
+)
+from src.sqlite_connector import readonly_authorizer
+
 
 class SQLExecutor:
     """
@@ -21,20 +29,13 @@ class SQLExecutor:
     """
 
     # Forbidden SQL patterns (Layer 1 security)
-    FORBIDDEN_PATTERNS = [
-        "INSERT",
-        "UPDATE",
-        "DELETE",
-        "DROP",
-        "CREATE",
-        "ALTER",
-        "TRUNCATE",
-        "PRAGMA",
-        "ATTACH",
-        "DETACH",
-        "VACUUM",
-        "REINDEX",
-    ]
+    FORBIDDEN_PATTERNS = FORBIDDEN_SQL_PATTERNS
+
+    # Compiled statements kept by the connection for re-executed SQL
+    STATEMENT_CACHE_SIZE = 256
+
+    # Rows fetched per batch when reading query results
+    FETCH_BATCH_SIZE = 256
 
     def __init__(self, db_path: str) -> None:
         """
@@ -50,6 +51,9 @@ class SQLExecutor:
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database file not found: {db_path}")
 
+        # Persistent READ ONLY connection reused by every query
+        self._conn = self._get_connection()
+
     def _get_connection(self) -> sqlite3.Connection:
         """
         Get READ ONLY database connection.
@@ -64,14 +68,20 @@ class SQLExecutor:
             - READ ONLY mode: Prevents write operations at DB level
             - URI mode: Enables file: protocol with mode parameter
             - Timeout: 30 seconds for query execution
+            - Authorizer: SQLite rejects write/schema operations at compile time
+
+        Performance:
+            - Statement cache: re-executed SQL skips parsing and compilation
         """
         conn = sqlite3.connect(
             f"file:{self.db_path}?mode=ro",
             uri=True,
             timeout=30.0,
             check_same_thread=False,
+            cached_statements=self.STATEMENT_CACHE_SIZE,
         )
-        conn.row_factory = sqlite3.Row
+        conn.set_authorizer(readonly_authorizer)
+        # Plain tuple rows: results are mapped to dicts once in execute_query
         return conn
 
     def _validate_sql(self, sql: str) -> Dict[str, Any]:
@@ -88,16 +98,19 @@ class SQLExecutor:
 
         Security checks:
             - Forbidden patterns (INSERT/UPDATE/DELETE/PRAGMA etc.)
-            - Multiple statements (semicolon count)
+            - Multiple statements (outside string literals and comments)
         """
+        # Mask string literals and comments
+        code = SQL_LITERAL_OR_COMMENT_RE.sub(" ", sql)
+
         # Check forbidden patterns
-        sql_upper = sql.upper()
-        for pattern in self.FORBIDDEN_PATTERNS:
-            if pattern in sql_upper:
-                return {"valid": False, "error": f"禁止操作が含まれています: {pattern}"}
+        match = FORBIDDEN_SQL_RE.search(code)
+        if match:
+            return {"valid": False, "error": f"禁止操作が含まれています: {match.group(1).upper()}"}
 
-        # Check multiple statements
-        if sql.count(";") > 1:
+        # Check multiple statements (non-empty statements between semicolons)
+        statements = [stmt for stmt in code.split(";") if stmt.strip()]
+        if len(statements) > 1:
             return {"valid": False, "error": "複数のステートメントは実行できません"}
 
         return {"valid": True}
@@ -144,28 +157,31 @@ class SQLExecutor:
 
         # Layer 3: Auto-inject LIMIT clause
         sql_stripped = sql.strip().rstrip(";")
-        if "LIMIT" not in sql_stripped.upper():
+        if not has_top_level_limit(sql_stripped):
             sql_executed = f"{sql_stripped} LIMIT {max_rows}"
         else:
             sql_executed = sql_stripped
 
         # Layer 2 & 4: READ ONLY connection with timeout
         try:
-            conn = self._get_connection()
-            cursor = conn.cursor()
+            cursor = self._conn.cursor()
 
             # Execute query
             cursor.execute(sql_executed)
-            rows = cursor.fetchall()
 
             # Extract column names
             columns = [desc[0] for desc in cursor.description]
 
-            # Convert rows to list of dictionaries
-            data = [dict(zip(columns, row)) for row in rows]
+            # Convert rows to list of dictionaries, one fetched batch at a time
+            column_keys = tuple(columns)
+            data = []
+            while True:
+                rows = cursor.fetchmany(self.FETCH_BATCH_SIZE)
+                if not rows:
+                    break
+                data.extend(dict(zip(column_keys, row)) for row in rows)
 
             cursor.close()
-            conn.close()
 
             return {
                 "success": True,
@@ -191,6 +207,12 @@ class SQLExecutor:
                 }
 
         except sqlite3.Error as e:
+            if "not authorized" in str(e).lower():
+                return {
+                    "success": False,
+                    "error": "禁止操作が含まれています（データベースにより拒否されました）",
+                    "sql_executed": sql_executed,
+                }
             return {
                 "success": False,
                 "error": f"データベースエラー: {str(e)}",
@@ -203,3 +225,11 @@ class SQLExecutor:
                 "error": f"予期しないエラー: {str(e)}",
                 "sql_executed": sql_executed,
             }
+
+    def close(self) -> None:
+        """
+        Close database connection.
+        """
+        if self._conn:
+            self._conn.close()
+            self._conn = None
@@ -6,7 +6,7 @@ This module provides SQL extraction with 4-level fallback patterns.
 
 import re
 import json
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 
 class SQLParser:
@@ -21,10 +21,40 @@ class SQLParser:
     - Pattern 4: Extraction failed
     """
 
+    # Pattern 1: ```sql``` code block
+    SQL_BLOCK_PATTERN = re.compile(r"```sql\s*(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+
+    # Pattern 2: optional ```json``` fence around JSON response
+    JSON_FENCE_PATTERN = re.compile(r"```(?:json)?\s*(.*?)\s*```$", re.DOTALL | re.IGNORECASE)
+
+    # Pattern 3: Direct SELECT/WITH statement
+    DIRECT_SQL_PATTERN = re.compile(r"((?:WITH|SELECT)\s+.*?)(?:;|\Z)", re.DOTALL | re.IGNORECASE)
+
+    # Pattern 0: ERROR: prefix after optional leading whitespace
+    ERROR_PREFIX_PATTERN = re.compile(r"\s*ERROR:")
+
+    # Answer marker in batch responses: [1], [2], ... at line start
+    BATCH_MARKER_PATTERN = re.compile(r"^\s*\[(\d+)\]", re.MULTILINE)
+
     def __init__(self) -> None:
         """Initialize SQLParser."""
         pass
 
+    def has_complete_sql_block(self, text: str) -> bool:
+        """
+        Check whether text already contains a closed ```sql``` code block.
+
+        Used while streaming AI responses to stop reading once the SQL is
+        complete.
+
+        Args:
+            text: Partial or complete AI response
+
+        Returns:
+            True if a complete ```sql``` block is present, False otherwise
+        """
+        return self.SQL_BLOCK_PATTERN.search(text) is not None
+
     def extract_sql(self, ai_response: str) -> Dict[str, Any]:
         """
         Extract SQL from AI response using 4-level fallback.
@@ -38,6 +68,7 @@ class SQLParser:
             - sql: Optional[str] - Extracted SQL (None if failed)
             - error_type: Optional[str] - Error type if failed
             - error_message: Optional[str] - Error message if failed
+            - candidates: Optional[List[str]] - All candidate SQLs (JSON candidates format only)
 
         Example:
             >>> parser = SQLParser()
@@ -48,7 +79,7 @@ class SQLParser:
             'SELECT * FROM members'
         """
         # Pattern 0: ERROR detection (TEST-F09)
-        if ai_response.strip().startswith("ERROR:"):
+        if self.ERROR_PREFIX_PATTERN.match(ai_response):
             return {
                 "success": False,
                 "sql": None,
@@ -57,22 +88,35 @@ class SQLParser:
             }
 
         # Pattern 1: ```sql``` code blocks
-        pattern1 = r"```sql\s*(.*?)\s*```"
-        match = re.search(pattern1, ai_response, re.DOTALL | re.IGNORECASE)
+        match = self.SQL_BLOCK_PATTERN.search(ai_response)
         if match:
             return {"success": True, "sql": match.group(1).strip()}
 
-        # Pattern 2: JSON format
-        try:
-            data = json.loads(ai_response)
-            if isinstance(data, dict) and "sql" in data:
-                return {"success": True, "sql": data["sql"].strip()}
-        except (json.JSONDecodeError, KeyError, AttributeError):
-            pass
+        # Pattern 2: JSON format (optionally wrapped in ```json``` block)
+        json_text = ai_response.strip()
+        if json_text.startswith("```"):
+            fence = self.JSON_FENCE_PATTERN.match(json_text)
+            if fence:
+                json_text = fence.group(1)
+
+        # Only a JSON object can carry SQL, so skip parsing anything else
+        if json_text.startswith("{"):
+            try:
+                data = json.loads(json_text)
+                if isinstance(data, dict):
+                    # Multiple candidates: {"candidates": ["SELECT ...", ...]}
+                    candidates = data.get("candidates")
+                    if isinstance(candidates, list):
+                        sqls = [c.strip() for c in candidates if isinstance(c, str) and c.strip()]
+                        if sqls:
+                            return {"success": True, "sql": sqls[0], "candidates": sqls}
+                    if "sql" in data:
+                        return {"success": True, "sql": data["sql"].strip()}
+            except (json.JSONDecodeError, KeyError, AttributeError):
+                pass
 
         # Pattern 3: Direct SELECT/WITH statements
-        pattern3 = r"((?:WITH|SELECT)\s+.*?)(?:;|\Z)"
-        match = re.search(pattern3, ai_response, re.DOTALL | re.IGNORECASE)
+        match = self.DIRECT_SQL_PATTERN.search(ai_response)
         if match:
             return {"success": True, "sql": match.group(1).strip()}
 
@@ -83,3 +127,42 @@ class SQLParser:
             "error_type": "extraction_failed",
             "error_message": "AI応答からSQLを抽出できませんでした",
         }
+
+    def batch_extract_sql(self, ai_response: str, count: int) -> List[Dict[str, Any]]:
+        """
+        Extract SQL for each question from a batch AI response.
+
+        Splits the response on [index] markers (see
+        PromptGenerator.batch_generate()) and applies extract_sql() to each
+        answer.
+
+        Args:
+            ai_response: Raw response from AI model
+            count: Number of questions in the batch prompt
+
+        Returns:
+            List of extraction results (same format as extract_sql()),
+            one per question in order. Missing answers are reported as
+            extraction_failed.
+        """
+        parts = self.BATCH_MARKER_PATTERN.split(ai_response)
+
+        # parts: [preamble, index1, answer1, index2, answer2, ...]
+        answers = {}
+        for index, answer in zip(parts[1::2], parts[2::2]):
+            answers.setdefault(int(index), answer)
+
+        results = []
+        for index in range(1, count + 1):
+            answer = answers.get(index)
+            if answer is None:
+                results.append({
+                    "success": False,
+                    "sql": None,
+                    "error_type": "extraction_failed",
+                    "error_message": f"AI応答から質問[{index}]の回答が見つかりませんでした",
+                })
+            else:
+                results.append(self.extract_sql(answer))
+
+        return results
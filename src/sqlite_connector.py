@@ -6,11 +6,89 @@ for SQLite databases with 4-layer security defense.
 """
 
 import sqlite3
+from itertools import groupby
 import pandas as pd
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from pathlib import Path
 
-from src.database_connector import DatabaseConnector
+from src.database_connector import (
+    FORBIDDEN_SQL_PATTERNS,
+    FORBIDDEN_SQL_RE,
+    SQL_LITERAL_OR_COMMENT_RE,
+    ColumnError,
+    DatabaseConnector,
+    TableError,
+    has_top_level_limit,
+)
+
+# Authorizer action codes for statements that modify data or schema
+_DENIED_ACTIONS = frozenset({
+    sqlite3.SQLITE_INSERT,
+    sqlite3.SQLITE_UPDATE,
+    sqlite3.SQLITE_DELETE,
+    sqlite3.SQLITE_CREATE_INDEX,
+    sqlite3.SQLITE_CREATE_TABLE,
+    sqlite3.SQLITE_CREATE_TEMP_INDEX,
+    sqlite3.SQLITE_CREATE_TEMP_TABLE,
+    sqlite3.SQLITE_CREATE_TEMP_TRIGGER,
+    sqlite3.SQLITE_CREATE_TEMP_VIEW,
+    sqlite3.SQLITE_CREATE_TRIGGER,
+    sqlite3.SQLITE_CREATE_VIEW,
+    sqlite3.SQLITE_CREATE_VTABLE,
+    sqlite3.SQLITE_DROP_INDEX,
+    sqlite3.SQLITE_DROP_TABLE,
+    sqlite3.SQLITE_DROP_TEMP_INDEX,
+    sqlite3.SQLITE_DROP_TEMP_TABLE,
+    sqlite3.SQLITE_DROP_TEMP_TRIGGER,
+    sqlite3.SQLITE_DROP_TEMP_VIEW,
+    sqlite3.SQLITE_DROP_TRIGGER,
+    sqlite3.SQLITE_DROP_VIEW,
+    sqlite3.SQLITE_DROP_VTABLE,
+    sqlite3.SQLITE_ALTER_TABLE,
+    sqlite3.SQLITE_ATTACH,
+    sqlite3.SQLITE_DETACH,
+    sqlite3.SQLITE_REINDEX,
+    sqlite3.SQLITE_ANALYZE,
+    sqlite3.SQLITE_PRAGMA,
+})
+
+
+def readonly_authorizer(
+    action: int,
+    arg1: Optional[str],
+    arg2: Optional[str],
+    db_name: Optional[str],
+    trigger: Optional[str],
+) -> int:
+    """
+    sqlite3 authorizer callback that rejects write and schema operations.
+
+    Checked by SQLite while compiling each statement, so string literals and
+    comments cannot hide or fake an operation.
+
+    Args:
+        action: Authorizer action code (sqlite3.SQLITE_*)
+        arg1: First action argument (table or pragma name)
+        arg2: Second action argument (column name or pragma argument)
+        db_name: Database name
+        trigger: Innermost trigger or view name
+
+    Returns:
+        sqlite3.SQLITE_OK to allow, sqlite3.SQLITE_DENY to reject
+    """
+    if action == sqlite3.SQLITE_PRAGMA:
+        # Introspection reads used by get_schema()
+        pragma = (arg1 or "").lower()
+        if pragma == "table_info" or (pragma == "schema_version" and arg2 is None):
+            return sqlite3.SQLITE_OK
+    elif action == sqlite3.SQLITE_UPDATE and arg1 == "sqlite_master":
+        # Checked internally by pragma table-valued functions;
+        # sqlite_master itself cannot be written
+        return sqlite3.SQLITE_OK
+
+    if action in _DENIED_ACTIONS:
+        return sqlite3.SQLITE_DENY
+    return sqlite3.SQLITE_OK
 
 
 class SQLiteConnector(DatabaseConnector):
@@ -25,20 +103,7 @@ class SQLiteConnector(DatabaseConnector):
     """
 
     # Forbidden SQL patterns (Layer 1 security)
-    FORBIDDEN_PATTERNS = [
-        "INSERT",
-        "UPDATE",
-        "DELETE",
-        "DROP",
-        "CREATE",
-        "ALTER",
-        "TRUNCATE",
-        "PRAGMA",
-        "ATTACH",
-        "DETACH",
-        "VACUUM",
-        "REINDEX",
-    ]
+    FORBIDDEN_PATTERNS = FORBIDDEN_SQL_PATTERNS
 
     def __init__(self, db_path: str) -> None:
         """
@@ -53,6 +118,10 @@ class SQLiteConnector(DatabaseConnector):
         self.db_path = db_path
         self.conn = None
 
+        # Schema memo, valid while the database schema_version is unchanged
+        self._schema_cache = None
+        self._schema_version = None
+
     def connect(self) -> None:
         """
         Establish persistent READ ONLY connection to SQLite database.
@@ -63,6 +132,7 @@ class SQLiteConnector(DatabaseConnector):
         Security:
             - READ ONLY mode: Prevents write operations at DB level
             - URI mode: Enables file: protocol with mode parameter
+            - Authorizer: SQLite rejects write/schema operations at compile time
         """
         self.conn = sqlite3.connect(
             f"file:{self.db_path}?mode=ro",
@@ -71,6 +141,7 @@ class SQLiteConnector(DatabaseConnector):
             check_same_thread=False,
         )
         self.conn.row_factory = sqlite3.Row
+        self.conn.set_authorizer(readonly_authorizer)
 
     def get_schema(self) -> List[Dict[str, Any]]:
         """
@@ -86,38 +157,51 @@ class SQLiteConnector(DatabaseConnector):
 
         Raises:
             Exception: If schema retrieval fails
+
+        Note:
+            The result is memoized per connection and reused as long as
+            PRAGMA schema_version is unchanged.
         """
         if not self.conn:
             raise RuntimeError("Database not connected. Call connect() first.")
 
         cursor = self.conn.cursor()
 
-        # Get all table names
+        # Reuse memoized schema unless the schema has been changed
+        schema_version = cursor.execute("PRAGMA schema_version").fetchone()[0]
+        if self._schema_cache is not None and schema_version == self._schema_version:
+            cursor.close()
+            return self._schema_cache
+
+        # Get column information for all tables in one statement
         cursor.execute(
-            "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+            "SELECT m.name, p.name, p.type, p.pk "
+            "FROM sqlite_master AS m JOIN pragma_table_info(m.name) AS p "
+            "WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' "
+            "ORDER BY m.name, p.cid"
         )
-        tables = [row[0] for row in cursor.fetchall()]
+        rows = cursor.fetchall()
+        cursor.close()
 
         schema = []
-        for table in tables:
-            # Get column information for each table
-            cursor.execute(f"PRAGMA table_info({table})")
-            columns_info = cursor.fetchall()
-
-            columns = []
-            for col in columns_info:
-                columns.append({
-                    "column_name": col[1],  # name
-                    "data_type": col[2],    # type
-                    "is_primary_key": bool(col[5])  # pk
-                })
+        for table, table_rows in groupby(rows, key=lambda row: row[0]):
+            # row: (table_name, column_name, type, pk)
+            columns = [
+                {
+                    "column_name": row[1],
+                    "data_type": row[2],
+                    "is_primary_key": bool(row[3])
+                }
+                for row in table_rows
+            ]
 
             schema.append({
                 "table_name": table,
                 "columns": columns
             })
 
-        cursor.close()
+        self._schema_cache = schema
+        self._schema_version = schema_version
         return schema
 
     def execute_query(self, sql: str, limit: int = 1000) -> pd.DataFrame:
@@ -132,7 +216,11 @@ class SQLiteConnector(DatabaseConnector):
             Query results as DataFrame
 
         Raises:
-            Exception: If query execution fails
+            PermissionError: If SQL contains forbidden operations or writes
+            ColumnError: If SQL references an unknown column
+            TableError: If SQL references an unknown table
+            ValueError: If SQL fails other validation checks
+            RuntimeError: If query execution fails for other reasons
 
         Security layers:
             1. Pattern validation (validate_sql)
@@ -146,29 +234,59 @@ class SQLiteConnector(DatabaseConnector):
         # Layer 1: Validate SQL
         validation = self.validate_sql(sql)
         if not validation["valid"]:
+            if validation["error_type"] == "forbidden_pattern":
+                raise PermissionError(validation["message"])
             raise ValueError(validation["message"])
 
         # Layer 3: Auto-inject LIMIT clause
         sql_stripped = sql.strip().rstrip(";")
-        if "LIMIT" not in sql_stripped.upper():
+        if not has_top_level_limit(sql_stripped):
             sql_executed = f"{sql_stripped} LIMIT {limit}"
         else:
             sql_executed = sql_stripped
 
         # Layer 2 & 4: Execute with READ ONLY connection and timeout
+        cursor = self.conn.cursor()
+        cursor.row_factory = None  # plain tuples for DataFrame.from_records
         try:
-            df = pd.read_sql_query(sql_executed, self.conn)
-            return df
+            cursor.execute(sql_executed)
+            columns = [desc[0] for desc in cursor.description]
+            return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+
+        except sqlite3.Error as e:
+            self._raise_execution_error(e)
 
-        except sqlite3.OperationalError as e:
-            error_msg = str(e)
-            if "readonly" in error_msg.lower() or "attempt to write" in error_msg.lower():
+        finally:
+            cursor.close()
+
+    def _raise_execution_error(self, error: Exception) -> None:
+        """
+        Convert SQLite error into typed exception.
+
+        Args:
+            error: Error raised while executing the query
+
+        Raises:
+            PermissionError: Write attempt on READ ONLY connection or
+                operation denied by the authorizer
+            ColumnError: Unknown column
+            TableError: Unknown table
+            RuntimeError: Other errors
+        """
+        error_msg = str(error)
+        if "not authorized" in error_msg.lower():
+            raise PermissionError("禁止操作が含まれています（データベースにより拒否されました）")
+        if isinstance(error, sqlite3.OperationalError):
+            error_msg_lower = error_msg.lower()
+            if "readonly" in error_msg_lower or "attempt to write" in error_msg_lower:
                 raise PermissionError("書込み操作は許可されていません（READ ONLYモード）")
+            elif "no such column" in error_msg_lower:
+                raise ColumnError(f"SQL実行エラー: {error_msg}")
+            elif "no such table" in error_msg_lower:
+                raise TableError(f"SQL実行エラー: {error_msg}")
             else:
                 raise RuntimeError(f"SQL実行エラー: {error_msg}")
-
-        except sqlite3.Error as e:
-            raise RuntimeError(f"データベースエラー: {str(e)}")
+        raise RuntimeError(f"データベースエラー: {error_msg}")
 
     def validate_sql(self, sql: str) -> Dict[str, Any]:
         """
@@ -185,20 +303,23 @@ class SQLiteConnector(DatabaseConnector):
 
         Security checks:
             - Forbidden patterns (INSERT/UPDATE/DELETE/PRAGMA etc.)
-            - Multiple statements (semicolon count)
+            - Multiple statements (outside string literals and comments)
         """
+        # Mask string literals and comments
+        code = SQL_LITERAL_OR_COMMENT_RE.sub(" ", sql)
+
         # Check forbidden patterns
-        sql_upper = sql.upper()
-        for pattern in self.FORBIDDEN_PATTERNS:
-            if pattern in sql_upper:
-                return {
-                    "valid": False,
-                    "error_type": "forbidden_pattern",
-                    "message": f"禁止操作が含まれています: {pattern}"
-                }
+        match = FORBIDDEN_SQL_RE.search(code)
+        if match:
+            return {
+                "valid": False,
+                "error_type": "forbidden_pattern",
+                "message": f"禁止操作が含まれています: {match.group(1).upper()}"
+            }
 
-        # Check multiple statements
-        if sql.count(";") > 1:
+        # Check multiple statements (non-empty statements between semicolons)
+        statements = [stmt for stmt in code.split(";") if stmt.strip()]
+        if len(statements) > 1:
             return {
                 "valid": False,
                 "error_type": "multiple_statements",
@@ -214,3 +335,5 @@ class SQLiteConnector(DatabaseConnector):
         if self.conn:
             self.conn.close()
             self.conn = None
+        self._schema_cache = None
+        self._schema_version = None